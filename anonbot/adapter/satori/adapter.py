@@ -1,4 +1,3 @@
-import json
 from typing_extensions import override
 from typing import Any, Literal, Optional
 
@@ -34,6 +33,9 @@ from .models import (
     IdentifyOperation
 )
 
+_operation_adapter: TypeAdapter[OperationType] = TypeAdapter(OperationType)
+'''信令类型校验器，构建开销较大故仅在导入时构建一次'''
+
 class Adapter(BaseAdapter):
     bots: dict[str, Bot]
     
@@ -78,8 +80,8 @@ class Adapter(BaseAdapter):
         return operation.model_dump_json(by_alias=True)
     
     def receive_operation(self, info: ClientInfo, ws: WebSocket) -> Operation:
-        operation_data = json.loads(ws.receive())
-        operation: OperationType = TypeAdapter(OperationType).validate_python(operation_data) # type: ignore
+        # 由 pydantic-core 直接解析 JSON，省去中间的 Python 字典
+        operation: OperationType = _operation_adapter.validate_json(ws.receive()) # type: ignore
         if isinstance(operation, EventOperation):
             self.sequences[info.identity] = operation.body.id
         return operation
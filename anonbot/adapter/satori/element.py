@@ -1,5 +1,7 @@
 import re
+from sys import intern
 from enum import IntEnum
+from functools import lru_cache
 from dataclasses import field, dataclass
 from typing import Any, Union, Literal, TypeVar, Callable, Iterable, Optional, TypeAlias, TypedDict, cast
 
@@ -7,6 +9,8 @@ T = TypeVar('T')
 
 def escape(text: str, inline: bool = False) -> str:
     '''转义字符串'''
+    if '&' not in text and '<' not in text and '>' not in text and (not inline or '"' not in text):
+        return text
     result = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
     return result.replace('"', '&quot;') if inline else result
 
@@ -25,7 +29,9 @@ def camel_case(text: str) -> str:
     '''转换为驼峰命名'''
     return re.sub('[_-]([a-z])', lambda m: m[0][1:].upper(), text)
 
+@lru_cache(maxsize=256)
 def param_case(text: str) -> str:
+    '''转换为短横线命名，结果会被缓存'''
     return re.sub(
         '.[A-Z]+', lambda m: m[0][0] + '-' + m[0][1:].lower(), uncapitalize(text).replace('_', '-')
     )
@@ -213,6 +219,8 @@ tag_pat_1 = re.compile(r'(?P<comment><!--[\s\S]*?-->)|(?P<tag><(/?)([^!\s>/]*)([
 tag_pat_2 = re.compile(r'(?P<comment><!--[\s\S]*?-->)|(?P<tag><(/?)([^!\s>/]*)([^>]*?)\s*(/?)>)|(?P<curly>\{(?P<derivative>[@:/#][^\s\}]*)?[\s\S]*?\})')
 attr_pat_1 = re.compile(r'([^\s=]+)(?:="(?P<value1>[^"]*)"|=\'(?P<value2>[^\']*)\')?', re.S)
 attr_pat_2 = re.compile(r'([^\s=]+)(?:="(?P<value1>[^"]*)"|=\'(?P<value2>[^\']*)\'|=\{(?P<value3>[^\}]+)\})?', re.S)
+strip_start_pat = re.compile(r'^\s*\n\s*')
+strip_end_pat = re.compile(r'\s*\n\s*$')
 
 class Position(IntEnum):
     OPEN = 0
@@ -249,26 +257,26 @@ def fold_tokens(tokens: list[Union[str, Token]]) -> list[Union[str, Token]]:
     ]
     
     def push_token(*tokens: Union[str, Token]) -> None:
-        token = stack[0]['token']
-        token.children[stack[0]['slot']].extend(tokens)
+        token = stack[-1]['token']
+        token.children[stack[-1]['slot']].extend(tokens)
     
     for token in tokens:
         if isinstance(token, str):
             push_token(token)
             continue
         if token.position == Position.CLOSE:
-            if stack[0]['token'].name == token.name:
-                stack.pop(0)
+            if stack[-1]['token'].name == token.name:
+                stack.pop()
         elif token.position == Position.CONTINUE:
-            stack[0]['token'].children[token.name] = []
-            stack[0]['slot'] = token.name
+            stack[-1]['token'].children[token.name] = []
+            stack[-1]['slot'] = token.name
         elif token.position == Position.OPEN:
             push_token(token)
             token.children = {'default': []}
-            stack.insert(0, {'token': token, 'slot': 'default'})
+            stack.append({'token': token, 'slot': 'default'})
         else:
             push_token(token)
-    return stack[-1]['token'].children['default']
+    return stack[0]['token'].children['default']
 
 def parse_tokens(tokens: list[Union[str, Token]], context: Optional[dict[str, Any]] = None) -> list[Element]:
     result: list[Element] = []
@@ -278,7 +286,7 @@ def parse_tokens(tokens: list[Union[str, Token]], context: Optional[dict[str, An
         elif token.type == 'angle':
             attrs = {}
             attr_pat = attr_pat_2 if context is not None else attr_pat_1
-            while mat := attr_pat.search(token.extra):
+            for mat in attr_pat.finditer(token.extra):
                 key = mat.group(1)
                 groupdict = mat.groupdict()
                 value = groupdict.get('value1') or groupdict.get('value2')
@@ -291,7 +299,6 @@ def parse_tokens(tokens: list[Union[str, Token]], context: Optional[dict[str, An
                     attrs[key[3:]] = False
                 else:
                     attrs[key] = True
-                token.extra = token.extra[mat.end():]
             result.append(
                 Element(
                     token.name,
@@ -325,20 +332,22 @@ def parse(src: str, context: Optional[dict[str, Any]] = None):
     def parse_content(source: str, _start: bool, _end: bool) -> None:
         source = unescape(source)
         if _start:
-            source = re.sub(r'^\s*\n\s*', '', source, re.MULTILINE)
+            source = strip_start_pat.sub('', source, 1)
         if _end:
-            source = re.sub(r'\s*\n\s*$', '', source, re.MULTILINE)
+            source = strip_end_pat.sub('', source, 1)
         push_text(source)
     
     tag_pat = tag_pat_2 if context is not None else tag_pat_1
     strip_start = True
+    pos = 0
     
-    while tag_mat := tag_pat.search(src):
+    # 通过位置推进扫描，避免每匹配一个标签就切片复制剩余字符串
+    while tag_mat := tag_pat.search(src, pos):
         groupdict = tag_mat.groupdict()
         strip_end = not bool(groupdict.get('curly'))
-        parse_content(src[:tag_mat.start()], strip_start, strip_end)
+        parse_content(src[pos:tag_mat.start()], strip_start, strip_end)
         strip_start = strip_end
-        src = src[tag_mat.end():]
+        pos = tag_mat.end()
         groups = tag_mat.groups()
         close, type_, extra, empty = groups[2], groups[3], groups[4], groups[5]
         if groupdict.get('comment'):
@@ -369,11 +378,12 @@ def parse(src: str, context: Optional[dict[str, Any]] = None):
         tokens.append(
             Token(
                 type='angle',
-                name=type_ or 'template',
+                # 标签名取值范围很小，驻留后下游按类型查表时可直接命中同一对象
+                name=intern(type_) if type_ else 'template',
                 position=Position.CLOSE if close else Position.EMPTY if empty else Position.OPEN,
                 source=tag_mat[0],
                 extra=extra
             )
         )
-    parse_content(src, strip_start, True)
+    parse_content(src[pos:], strip_start, True)
     return parse_tokens(fold_tokens(tokens), context)
@@ -602,10 +602,13 @@ class ReactionEvent(Event):
         else:
             return f'{self.channel.id}:{self.get_user_id()}'
     
-    @model_validator(mode='after')
-    def generate_message(self) -> Self:
-        self._message = Message.from_satori_element(parse(self.message.content))
-        return self
+    def __getattr__(self, item: str) -> Any:
+        if item == '_message':
+            # 表态事件的消息内容极少被使用，首次访问时才解析
+            message = Message.from_satori_element(parse(self.message.content))
+            self._message = message
+            return message
+        return super().__getattr__(item) # type: ignore
     
     @property
     def message_id(self) -> str:
@@ -1,7 +1,9 @@
-import re
+import os
 from pathlib import Path
+from functools import lru_cache
+from itertools import pairwise
 from base64 import b64encode
-from dataclasses import InitVar, field, dataclass
+from dataclasses import InitVar, dataclass
 from typing_extensions import override
 from typing import (
     Any,
@@ -11,6 +13,7 @@ from typing import (
     Tuple,
     Union,
     Literal,
+    Callable,
     Iterable,
     Optional,
     Generator,
@@ -24,42 +27,137 @@ from anonbot.adapter import MessageSegment as BaseMessageSegment
 
 from .element import Element, parse, escape, param_case
 
+_HTTP_SCHEMES = ('http://', 'https://')
+'''视为链接的资源前缀'''
+
+_B64_CHUNK_SIZE = 48 * 1024
+'''分块编码大小，需为 3 的倍数以保证各块编码结果可直接拼接'''
+
+try:
+    from pybase64 import b64encode_as_string
+except ImportError:
+    b64encode_as_string = None
+
+def _encode_base64(prefix: str, data: Union[bytes, memoryview]) -> str:
+    '''将数据编码为 base64 并拼接在前缀之后'''
+    if b64encode_as_string is not None:
+        return prefix + b64encode_as_string(data)
+    # 分块编码，避免为整个数据生成中间 bytes 对象，并与前缀一次性拼接
+    chunks = [prefix]
+    with memoryview(data) as view:
+        for i in range(0, len(view), _B64_CHUNK_SIZE):
+            chunks.append(b64encode(view[i:i + _B64_CHUNK_SIZE]).decode('ascii'))
+    return ''.join(chunks)
+
+@lru_cache(maxsize=1024)
+def _absolute_path_to_uri(path: str) -> str:
+    '''将绝对路径转换为 file URI'''
+    return Path(path).as_uri()
+
+def _path_to_uri(path: str) -> str:
+    '''将本地路径转换为 file URI，相对路径以当前工作目录为准'''
+    # 缓存仅以绝对路径为键，切换工作目录后不会命中过期结果
+    if not os.path.isabs(path):
+        path = os.path.join(os.getcwd(), path)
+    return _absolute_path_to_uri(path)
+
+def _str_src_to_uri(src: str) -> str:
+    # 判断链接或路径
+    if src.startswith(_HTTP_SCHEMES):
+        return src
+    return _path_to_uri(src)
+
+def _path_src_to_uri(src: Path) -> str:
+    return _path_to_uri(os.fspath(src))
+
+def _base64_src_to_uri(src: SrcBase64) -> str:
+    prefix = f'data:{src["type"]};base64,'
+    data = src['data']
+    if isinstance(data, bytes):
+        return _encode_base64(prefix, data)
+    # 直接使用 BytesIO 的底层缓冲区，编码完成后立即释放以免锁定缓冲区
+    with data.getbuffer() as buffer:
+        return _encode_base64(prefix, buffer)
+
+_SRC_HANDLERS: dict[type, Callable[[Any], str]] = {
+    str: _str_src_to_uri,
+    type(Path()): _path_src_to_uri,
+    dict: _base64_src_to_uri
+}
+'''资源类型到转换函数的映射'''
+
 def _parse_src(src: Union[str, Path, SrcBase64]) -> str:
+    if (handler := _SRC_HANDLERS.get(type(src))) is not None:
+        return handler(src)
     if isinstance(src, str):
-        # 判断链接或路径
-        if re.match(r'^https?://', src):
-            return src
-        else:
-            return Path(src).absolute().as_uri()
+        return _str_src_to_uri(src)
     elif isinstance(src, Path):
-        return src.absolute().as_uri()
-    else:
-        bytes_data = src['data'] if isinstance(src['data'], bytes) else src['data'].getvalue() # type: ignore
-        return f'data:{src["type"]};base64,{b64encode(bytes_data).decode()}'
+        return _path_src_to_uri(src)
+    return _base64_src_to_uri(src)
+
+_ESCAPE_CACHE_MAX_LENGTH = 256
+'''可缓存转义结果的属性值最大长度，避免缓存 base64 等大体积数据'''
 
+@lru_cache(maxsize=4096)
+def _escape_attr_cached(value: str) -> str:
+    return escape(value, True)
+
+def _escape_attr(value: str) -> str:
+    if len(value) > _ESCAPE_CACHE_MAX_LENGTH:
+        return escape(value, True)
+    return _escape_attr_cached(value)
+
+def _update_optional(data: Any, **kwargs: Any) -> None:
+    for key, value in kwargs.items():
+        if value is not None:
+            data[key] = value
+
+def _style_text(style: str, text: Union[str, 'Text']) -> 'Text':
+    if isinstance(text, str):
+        return Text('text', {'text': text, 'styles': {(0, len(text)): [style]}})
+    text.data['styles'].setdefault((0, len(text.data['text'])), []).insert(0, style)
+    return text
+
+@dataclass(slots=True)
 class MessageSegment(BaseMessageSegment['Message']):
     children: Optional['Message'] = None
     '''消息段子消息'''
     
     def __str__(self) -> str:
-        def _attr(key: str, value: Any) -> str:
+        if self.type == 'text' and 'text' in self.data:
+            return escape(self.data['text'])
+        if self.children is None:
+            return f'<{self.type}{self._attrs()}/>'
+        parts: list[str] = []
+        self.write_to(parts.append)
+        return ''.join(parts)
+    
+    def _attrs(self) -> str:
+        parts: list[str] = []
+        for key, value in self.data.items():
             if value is None:
-                return ''
+                continue
             key = param_case(key)
             if value is True:
-                return f' {key}'
-            if isinstance(value, str):
-                return f' {key}="{escape(value, True)}"'
+                parts.append(f' {key}')
+            elif isinstance(value, str):
+                parts.append(f' {key}="{_escape_attr(value)}"')
             else:
-                return f' {key}="{escape(str(value), True)}"'
-        
-        attrs = ''.join(_attr(k, v) for k, v in self.data.items())
-        if self.type == 'text' and 'text' in self.data:
-            return escape(self.data['text'])
-        if self.children is None:
-            return f'<{self.type}{attrs}/>'
-        else:
-            return f'<{self.type}{attrs}>{str(self.children)}</{self.type}>'
+                parts.append(f' {key}="{_escape_attr(str(value))}"')
+        return ''.join(parts)
+    
+    def write_to(self, write: Callable[[str], Any]) -> None:
+        '''将消息段逐段写入 `write`，子消息直接写入而不先拼接为字符串
+
+        参数:
+            write (Callable[[str], Any]): 写入函数，如 `list.append` 或 `IO.write`
+        '''
+        if self.children is None or (self.type == 'text' and 'text' in self.data):
+            write(str(self))
+            return
+        write(f'<{self.type}{self._attrs()}>')
+        self.children.write_to(write)
+        write(f'</{self.type}>')
     
     def __extra_attr__(self, *inner_attrs: str) -> str:
         def _attr(key: str, value: Any) -> str:
@@ -70,7 +168,7 @@ class MessageSegment(BaseMessageSegment['Message']):
                 return f' {key}'
             if value is False:
                 return f' no-{key}'
-            return f' {key}="{escape(value, True)}"'
+            return f' {key}="{_escape_attr(value)}"'
         
         attrs = ''.join(_attr(k, v) for k, v in self.data.items() if k not in inner_attrs)
         return f'{attrs}'
@@ -148,16 +246,14 @@ class MessageSegment(BaseMessageSegment['Message']):
         height: Optional[int] = None
     ) -> 'Img':
         data: ImgData = {'src': _parse_src(src)}
-        if title is not None:
-            data['title'] = title
-        if cache is not None:
-            data['cache'] = cache
-        if timeout is not None:
-            data['timeout'] = timeout
-        if width is not None:
-            data['width'] = width
-        if height is not None:
-            data['height'] = height
+        _update_optional(
+            data,
+            title=title,
+            cache=cache,
+            timeout=timeout,
+            width=width,
+            height=height
+        )
         return Img('img', data)
     
     @staticmethod
@@ -170,16 +266,14 @@ class MessageSegment(BaseMessageSegment['Message']):
         poster: Optional[str] = None
     ) -> 'Audio':
         data: AudioData = {'src': _parse_src(src)}
-        if title is not None:
-            data['title'] = title
-        if cache is not None:
-            data['cache'] = cache
-        if timeout is not None:
-            data['timeout'] = timeout
-        if duration is not None:
-            data['duration'] = duration
-        if poster is not None:
-            data['poster'] = poster
+        _update_optional(
+            data,
+            title=title,
+            cache=cache,
+            timeout=timeout,
+            duration=duration,
+            poster=poster
+        )
         return Audio('audio', data)
     
     @staticmethod
@@ -194,20 +288,16 @@ class MessageSegment(BaseMessageSegment['Message']):
         poster: Optional[str] = None
     ) -> 'Video':
         data: VideoData = {'src': _parse_src(src)}
-        if title is not None:
-            data['title'] = title
-        if cache is not None:
-            data['cache'] = cache
-        if timeout is not None:
-            data['timeout'] = timeout
-        if width is not None:
-            data['width'] = width
-        if height is not None:
-            data['height'] = height
-        if duration is not None:
-            data['duration'] = duration
-        if poster is not None:
-            data['poster'] = poster
+        _update_optional(
+            data,
+            title=title,
+            cache=cache,
+            timeout=timeout,
+            width=width,
+            height=height,
+            duration=duration,
+            poster=poster
+        )
         return Video('video', data)
     
     @staticmethod
@@ -219,82 +309,54 @@ class MessageSegment(BaseMessageSegment['Message']):
         poster: Optional[str] = None
     ) -> 'File':
         data: FileData = {'src': _parse_src(src)}
-        if title is not None:
-            data['title'] = title
-        if cache is not None:
-            data['cache'] = cache
-        if timeout is not None:
-            data['timeout'] = timeout
-        if poster is not None:
-            data['poster'] = poster
+        _update_optional(
+            data,
+            title=title,
+            cache=cache,
+            timeout=timeout,
+            poster=poster
+        )
         return File('file', data)
     
     @staticmethod
     def b(text: Union[str, 'Text']) -> 'Text':
-        if isinstance(text, str):
-            return Text('text', {'text': text, 'styles': {(0, len(text)): ['b']}})
-        text.data['styles'].setdefault((0, len(text.data['text'])), []).insert(0, 'b')
-        return text
+        return _style_text('b', text)
     
     @staticmethod
     def i(text: Union[str, 'Text']) -> 'Text':
-        if isinstance(text, str):
-            return Text('text', {'text': text, 'styles': {(0, len(text)): ['i']}})
-        text.data['styles'].setdefault((0, len(text.data['text'])), []).insert(0, 'i')
-        return text
+        return _style_text('i', text)
     
     @staticmethod
     def u(text: Union[str, 'Text']) -> 'Text':
-        if isinstance(text, str):
-            return Text('text', {'text': text, 'styles': {(0, len(text)): ['u']}})
-        text.data['styles'].setdefault((0, len(text.data['text'])), []).insert(0, 'u')
-        return text
+        return _style_text('u', text)
     
     @staticmethod
     def s(text: Union[str, 'Text']) -> 'Text':
-        if isinstance(text, str):
-            return Text('text', {'text': text, 'styles': {(0, len(text)): ['s']}})
-        text.data['styles'].setdefault((0, len(text.data['text'])), []).insert(0, 's')
-        return text
+        return _style_text('s', text)
     
     @staticmethod
     def spl(text: Union[str, 'Text']) -> 'Text':
-        if isinstance(text, str):
-            return Text('text', {'text': text, 'styles': {(0, len(text)): ['spl']}})
-        text.data['styles'].setdefault((0, len(text.data['text'])), []).insert(0, 'spl')
-        return text
+        return _style_text('spl', text)
     
     @staticmethod
     def code(text: Union[str, 'Text']) -> 'Text':
-        if isinstance(text, str):
-            return Text('text', {'text': text, 'styles': {(0, len(text)): ['code']}})
-        text.data['styles'].setdefault((0, len(text.data['text'])), []).insert(0, 'code')
-        return text
+        return _style_text('code', text)
     
     @staticmethod
     def sup(text: Union[str, 'Text']) -> 'Text':
-        if isinstance(text, str):
-            return Text('text', {'text': text, 'styles': {(0, len(text)): ['sup']}})
-        text.data['styles'].setdefault((0, len(text.data['text'])), []).insert(0, 'sup')
-        return text
+        return _style_text('sup', text)
     
     @staticmethod
     def sub(text: Union[str, 'Text']) -> 'Text':
-        if isinstance(text, str):
-            return Text('text', {'text': text, 'styles': {(0, len(text)): ['sub']}})
-        text.data['styles'].setdefault((0, len(text.data['text'])), []).insert(0, 'sub')
-        return text
+        return _style_text('sub', text)
     
     @staticmethod
-    def br() -> 'Br':
-        return Br('br', {'text': '\n'})
+    def p(text: Union[str, 'Text']) -> 'Text':
+        return _style_text('p', text)
     
     @staticmethod
-    def p(text: Union[str, 'Text']) -> 'Text':
-        if isinstance(text, str):
-            return Text('text', {'text': text, 'styles': {(0, len(text)): ['p']}})
-        text.data['styles'].setdefault((0, len(text.data['text'])), []).insert(0, 'p')
-        return text
+    def br() -> 'Br':
+        return Br('br', {'text': '\n'})
     
     @staticmethod
     def message(
@@ -372,7 +434,11 @@ class MessageSegment(BaseMessageSegment['Message']):
         children = None
         for key, value in kwargs.items():
             if isinstance(value, (Message, MessageSegment)):
-                children = Message(children) + value
+                # 原地合并子元素，避免每个参数都复制一次整个 Message
+                if children is None:
+                    children = Message()
+                for seg in Message(value):
+                    children._append_merging(seg.copy())
             else:
                 data[key] = value
         return Extend(type, data).set_children(children)
@@ -385,45 +451,45 @@ class TextData(TypedDict):
     text: str
     styles: dict[Tuple[int, int], list[str]]
 
-@dataclass
+@dataclass(slots=True)
 class Text(MessageSegment):
-    data: TextData = field(default_factory=dict) # type: ignore
+    data: TextData # type: ignore
     
     def __post_init__(self) -> None:
         if 'styles' not in self.data:
             self.data['styles'] = {}
     
     def __merge__(self) -> None:
-        data: dict[int, list[str]] = {}
         styles = self.data['styles']
         if not styles:
             return
-        for scale, _styles in styles.items():
-            for i in range(*scale):
-                if i not in data:
-                    data[i] = _styles[:]
-                else:
-                    data[i].extend(_style for _style in _styles if _style not in data[i])
+        scales = list(styles.items())
+        opening: dict[int, list[int]] = {}
+        for index, ((left, _), _) in enumerate(scales):
+            opening.setdefault(left, []).append(index)
+        points = sorted({point for scale, _ in scales for point in scale})
+        # 扫描线合并：按位置依次更新生效的样式区间，样式顺序与区间插入顺序一致
+        active: set[int] = set()
+        merged: dict[Tuple[int, int], list[str]] = {}
+        last_scale: Optional[Tuple[int, int]] = None
+        last_styles: list[str] = []
+        for start, end in zip(points, points[1:]):
+            active = {index for index in active if scales[index][0][1] > start}
+            active.update(index for index in opening.get(start, ()) if scales[index][0][1] > start)
+            current: list[str] = []
+            for index in sorted(active):
+                current.extend(style for style in scales[index][1] if style not in current)
+            if not current:
+                last_scale = None
+                continue
+            if last_scale is not None and last_scale[1] == start and current == last_styles:
+                del merged[last_scale]
+                last_scale = (last_scale[0], end)
+            else:
+                last_scale = (start, end)
+            merged[last_scale] = last_styles = current
         styles.clear()
-        data1: dict[str, list[int]] = {}
-        for i, _styles in data.items():
-            key = '\x01'.join(_styles)
-            data1.setdefault(key, []).append(i)
-        data.clear()
-        data2: dict[Tuple[int, int], list[str]] = {}
-        for key, indexes in data1.items():
-            start = indexes[0]
-            end = start
-            for i in indexes[1:]:
-                if i - end == 1:
-                    end = i
-                else:
-                    data2[(start, end + 1)] = key.split('\x01')
-                    start = end = i
-            if end >= start:
-                data2[(start, end + 1)] = key.split('\x01')
-        for scale in sorted(data2.keys()):
-            styles[scale] = data2[scale]
+        styles.update(merged)
     
     def mark(self, start: int, end: int, *styles: str) -> Self:
         _styles = self.data['styles'].setdefault((start, end), [])
@@ -436,26 +502,33 @@ class Text(MessageSegment):
     
     @override
     def __str__(self) -> str:
-        result: list[str] = []
         text = self.data['text']
         styles = self.data['styles']
         if not styles:
-            return escape(self.data['text'])
+            return escape(text)
         self.__merge__()
-        scales = sorted(styles.keys(), key=lambda x: x[0])
-        left = scales[0][0]
-        result.append(escape(text[:left]))
-        for scale in scales:
-            prefix = ''.join(f'<{style}>' for style in styles[scale])
-            suffix = ''.join(f'</{style}>' for style in reversed(styles[scale]))
-            result.append(prefix + escape(text[scale[0]:scale[1]]) + suffix)
-        right = scales[-1][1]
-        result.append(escape(text[right:]))
-        text = ''.join(result)
-        pat = re.compile(r'</(\w+)(?<!/p)><\1>')
-        for _ in range(max(map(len, styles.values()))):
-            text = pat.sub('', text)
-        return text
+        result: list[str] = []
+        opened: list[str] = []
+        cursor = 0
+        for (start, end), _styles in styles.items():
+            if start != cursor:
+                result.extend(_CLOSE_TAGS.get(style) or f'</{style}>' for style in reversed(opened))
+                result.append(escape(text[cursor:start]))
+                opened = []
+            # 与上一区间共享的样式前缀无需重复闭合与开启，段落 `p` 除外
+            shared = 0
+            for opened_style, style in zip(opened, _styles):
+                if opened_style != style or style == 'p':
+                    break
+                shared += 1
+            result.extend(_CLOSE_TAGS.get(style) or f'</{style}>' for style in reversed(opened[shared:]))
+            result.extend(_OPEN_TAGS.get(style) or f'<{style}>' for style in _styles[shared:])
+            result.append(escape(text[start:end]))
+            opened = _styles
+            cursor = end
+        result.extend(_CLOSE_TAGS.get(style) or f'</{style}>' for style in reversed(opened))
+        result.append(escape(text[cursor:]))
+        return ''.join(result)
     
     @override
     def is_text(self) -> bool:
@@ -467,23 +540,24 @@ class AtData(TypedDict):
     role: NotRequired[str]
     type: NotRequired[str]
 
-@dataclass
+@dataclass(slots=True)
 class At(MessageSegment):
-    data: AtData = field(default_factory=dict) # type: ignore
+    data: AtData # type: ignore
 
 class SharpData(TypedDict):
     id: str
     name: NotRequired[str]
 
-@dataclass
+@dataclass(slots=True)
 class Sharp(MessageSegment):
-    data: SharpData = field(default_factory=dict) # type: ignore
+    data: SharpData # type: ignore
 
 class AData(TypedDict):
     href: str
 
+@dataclass(slots=True)
 class A(MessageSegment):
-    data: AData = field(default_factory=dict) # type: ignore
+    data: AData # type: ignore
     
     @override
     def is_text(self) -> bool:
@@ -495,31 +569,30 @@ class SrcData(TypedDict):
     cache: NotRequired[bool]
     timeout: NotRequired[str]
 
-class ImgData(SrcData, total=False):
-    width: NotRequired[int]
-    height: NotRequired[int]
-
-@dataclass
-class Img(MessageSegment):
-    data: ImgData = field(default_factory=dict) # type: ignore
+@dataclass(slots=True)
+class _SrcSegment(MessageSegment):
+    '''资源消息段基类，可通过 `extra` 补充额外数据'''
     extra: InitVar[Optional[dict[str, Any]]] = None
     
     def __post_init__(self, extra: Optional[dict[str, Any]]) -> None:
         if extra is not None:
             self.data.update(extra) # type: ignore
 
+class ImgData(SrcData, total=False):
+    width: NotRequired[int]
+    height: NotRequired[int]
+
+@dataclass(slots=True)
+class Img(_SrcSegment):
+    data: ImgData # type: ignore
+
 class AudioData(SrcData, total=False):
     duration: NotRequired[float]
     poster: NotRequired[str]
 
-@dataclass
-class Audio(MessageSegment):
-    data: AudioData = field(default_factory=dict) # type: ignore
-    extra: InitVar[Optional[dict[str, Any]]] = None
-    
-    def __post_init__(self, extra: Optional[dict[str, Any]]) -> None:
-        if extra is not None:
-            self.data.update(extra) # type: ignore
+@dataclass(slots=True)
+class Audio(_SrcSegment):
+    data: AudioData # type: ignore
 
 class VideoData(SrcData, total=False):
     width: NotRequired[int]
@@ -527,27 +600,18 @@ class VideoData(SrcData, total=False):
     duration: NotRequired[float]
     poster: NotRequired[str]
 
-@dataclass
-class Video(MessageSegment):
-    data: VideoData = field(default_factory=dict) # type: ignore
-    extra: InitVar[Optional[dict[str, Any]]] = None
-    
-    def __post_init__(self, extra: Optional[dict[str, Any]]) -> None:
-        if extra is not None:
-            self.data.update(extra) # type: ignore
+@dataclass(slots=True)
+class Video(_SrcSegment):
+    data: VideoData # type: ignore
 
 class FileData(SrcData, total=False):
     poster: NotRequired[str]
 
-@dataclass
-class File(MessageSegment):
-    data: FileData = field(default_factory=dict) # type: ignore
-    extra: InitVar[Optional[dict[str, Any]]] = None
-    
-    def __post_init__(self, extra: Optional[dict[str, Any]]) -> None:
-        if extra is not None:
-            self.data.update(extra) # type: ignore
+@dataclass(slots=True)
+class File(_SrcSegment):
+    data: FileData # type: ignore
 
+@dataclass(slots=True)
 class Br(MessageSegment):
     
     @override
@@ -558,26 +622,26 @@ class RenderMessageData(TypedDict):
     id: NotRequired[str]
     forward: NotRequired[bool]
 
-@dataclass
+@dataclass(slots=True)
 class RenderMessage(MessageSegment):
-    data: RenderMessageData = field(default_factory=dict) # type: ignore
+    data: RenderMessageData # type: ignore
     
 class QuoteData(TypedDict):
     id: NotRequired[str]
     forward: NotRequired[bool]
 
-@dataclass
+@dataclass(slots=True)
 class Quote(MessageSegment):
-    data: QuoteData = field(default_factory=dict) # type: ignore
+    data: QuoteData # type: ignore
 
 class AuthorData(TypedDict):
     id: str
     name: NotRequired[str]
     avatar: NotRequired[str]
 
-@dataclass
+@dataclass(slots=True)
 class Author(MessageSegment):
-    data: AuthorData = field(default_factory=dict) # type: ignore
+    data: AuthorData # type: ignore
 
 class ButtonData(TypedDict):
     id: NotRequired[str]
@@ -586,17 +650,17 @@ class ButtonData(TypedDict):
     text: NotRequired[str]
     theme: NotRequired[str]
 
-@dataclass
+@dataclass(slots=True)
 class Button(MessageSegment):
-    data: ButtonData = field(default_factory=dict) # type: ignore
+    data: ButtonData # type: ignore
 
 class PassiveData(TypedDict):
     id: NotRequired[str]
     seq: NotRequired[int]
 
-@dataclass
+@dataclass(slots=True)
 class Extend(MessageSegment):
-    data: dict[str, Any] = field(default_factory=dict)
+    data: dict[str, Any]
     
     @override
     def is_text(self) -> bool:
@@ -616,7 +680,9 @@ ELEMENT_TYPE_MAP = {
     'audio': (Audio, 'audio'),
     'video': (Video, 'video'),
     'file': (File, 'file'),
-    'author': (Author, 'author')
+    'author': (Author, 'author'),
+    'message': (RenderMessage, 'message'),
+    'quote': (Quote, 'quote')
 }
 
 STYLE_TYPE_MAP = {
@@ -635,43 +701,155 @@ STYLE_TYPE_MAP = {
     'p': 'p'
 }
 
-def handle(element: Element, upper_style: Optional[list[str]] = None) -> Generator[Any, None, None]:
+_LINK_TAGS = frozenset(('a', 'link'))
+'''链接元素标签'''
+_BR_TAGS = frozenset(('br', 'newline'))
+'''换行元素标签'''
+
+_OPEN_TAGS = {style: f'<{style}>' for style in STYLE_TYPE_MAP.values()}
+'''样式开启标签'''
+_CLOSE_TAGS = {style: f'</{style}>' for style in STYLE_TYPE_MAP.values()}
+'''样式闭合标签'''
+
+def handle(element: Element, upper_style: Tuple[str, ...] = ()) -> Generator[Any, None, None]:
     tag = element.tag()
-    if len(element.children) > 0:
-        children = Message.from_satori_element(element.children)
-    else:
-        children = None
-    if tag in ELEMENT_TYPE_MAP:
-        seg_cls, seg_type = ELEMENT_TYPE_MAP[tag]
-        yield seg_cls(seg_type, element.attrs.copy()).set_children(children)
-    elif tag in ('a', 'link'):
-        attrs = element.attrs.copy()
-        yield A('a', attrs | {'href': attrs.get('href', '')}).set_children(children)
-    elif tag in STYLE_TYPE_MAP:
-        style = STYLE_TYPE_MAP[tag]
+    if (style := STYLE_TYPE_MAP.get(tag)) is not None:
+        styles = upper_style + (style,)
         for child in element.children:
-            child_tag = child.tag()
-            if child_tag == 'text':
+            if child.tag() == 'text':
                 yield Text(
                     'text',
                     {
                         'text': child.attrs['text'],
-                        'styles': {(0, len(child.attrs['text'])): [*(upper_style or []), style]}
+                        'styles': {(0, len(child.attrs['text'])): list(styles)}
                     }
                 )
             else:
-                yield from handle(child, [*(upper_style or []), style])
-    elif tag in ('br', 'newline'):
+                yield from handle(child, styles)
+        return
+    if len(element.children) > 0:
+        children = Message.from_satori_element(element.children)
+    else:
+        children = None
+    # 消息段会原地修改 attrs，复制一份以免污染调用方的元素树
+    attrs = dict(element.attrs)
+    if (entry := ELEMENT_TYPE_MAP.get(tag)) is not None:
+        seg_cls, seg_type = entry
+        yield seg_cls(seg_type, attrs).set_children(children)
+    elif tag in _LINK_TAGS:
+        attrs.setdefault('href', '')
+        yield A('a', attrs).set_children(children) # type: ignore
+    elif tag in _BR_TAGS:
         yield Br('br', {'text': '\n'}).set_children(children)
-    elif tag in ('message', 'quote'):
-        data = element.attrs.copy()
-        if tag == 'message':
-            yield RenderMessage('message', data).set_children(children) # type: ignore
-        else:
-            yield Quote('quote', data).set_children(children) # type: ignore
     else:
-        data = element.attrs.copy()
-        yield Extend(element.tag(), data).set_children(children)
+        yield Extend(tag, attrs).set_children(children)
+
+def _uni_text(seg: uni.MessageSegment) -> MessageSegment:
+    return MessageSegment.text(seg.text)
+
+def _uni_at(seg: uni.MessageSegment) -> MessageSegment:
+    return MessageSegment.at(
+        id=seg.data.get('id', None),
+        name=seg.data.get('name', None),
+        role=seg.data.get('role', None),
+        type=seg.data.get('type', None)
+    )
+
+def _uni_sharp(seg: uni.MessageSegment) -> MessageSegment:
+    return MessageSegment.sharp(seg.data['id'], seg.data.get('name', None))
+
+def _uni_link(seg: uni.MessageSegment) -> MessageSegment:
+    return MessageSegment.a(seg.data['href'])
+
+def _uni_image(seg: uni.MessageSegment) -> MessageSegment:
+    return MessageSegment.img(
+        src=seg.data['src'],
+        title=seg.data.get('title', None),
+        cache=seg.data.get('cache', None),
+        timeout=seg.data.get('timeout', None),
+        width=seg.data.get('width', None),
+        height=seg.data.get('height', None)
+    )
+
+def _uni_audio(seg: uni.MessageSegment) -> MessageSegment:
+    return MessageSegment.audio(
+        src=seg.data['src'],
+        title=seg.data.get('title', None),
+        cache=seg.data.get('cache', None),
+        timeout=seg.data.get('timeout', None),
+        duration=seg.data.get('duration', None),
+        poster=seg.data.get('poster', None)
+    )
+
+def _uni_video(seg: uni.MessageSegment) -> MessageSegment:
+    return MessageSegment.video(
+        src=seg.data['src'],
+        title=seg.data.get('title', None),
+        cache=seg.data.get('cache', None),
+        timeout=seg.data.get('timeout', None),
+        width=seg.data.get('width', None),
+        height=seg.data.get('height', None),
+        duration=seg.data.get('duration', None),
+        poster=seg.data.get('poster', None)
+    )
+
+def _uni_file(seg: uni.MessageSegment) -> MessageSegment:
+    return MessageSegment.file(
+        src=seg.data['src'],
+        title=seg.data.get('title', None),
+        cache=seg.data.get('cache', None),
+        timeout=seg.data.get('timeout', None),
+        poster=seg.data.get('poster', None)
+    )
+
+def _uni_style(seg: uni.MessageSegment) -> MessageSegment:
+    return Text('text', {'text': seg.text, 'styles': {(0, len(seg.text)): [seg.style]}})
+
+def _uni_br(seg: uni.MessageSegment) -> MessageSegment:
+    return MessageSegment.br()
+
+def _uni_message(seg: uni.MessageSegment) -> MessageSegment:
+    return MessageSegment.message(id=seg.data.get('id', None), forward=seg.data.get('forward', None))
+
+def _uni_author(seg: uni.MessageSegment) -> MessageSegment:
+    return MessageSegment.author(
+        id=seg.data['id'],
+        name=seg.data.get('name', None),
+        avatar=seg.data.get('avatar', None)
+    )
+
+def _uni_button(seg: uni.MessageSegment) -> MessageSegment:
+    return MessageSegment.button(
+        id=seg.data.get('id', None),
+        type=seg.data.get('type', None),
+        href=seg.data.get('href', None),
+        text=seg.data.get('text', None),
+        theme=seg.data.get('theme', None)
+    )
+
+def _uni_extend(seg: uni.MessageSegment) -> MessageSegment:
+    return MessageSegment.extend(seg.type)
+
+_UNI_SEGMENT_BUILDERS: dict[str, Callable[[uni.MessageSegment], MessageSegment]] = {
+    'text': _uni_text,
+    'at': _uni_at,
+    'sharp': _uni_sharp,
+    'link': _uni_link,
+    'image': _uni_image,
+    'audio': _uni_audio,
+    'video': _uni_video,
+    'file': _uni_file,
+    'style': _uni_style,
+    'br': _uni_br,
+    'message': _uni_message,
+    'quote': _uni_message,
+    'author': _uni_author,
+    'button': _uni_button
+}
+'''uni 消息段类型到构造函数的映射'''
+
+_UNI_TEXT_TYPES = frozenset(('text', 'style', 'br'))
+'''无需合并数据与子消息的 uni 消息段类型'''
 
 class Message(BaseMessage[MessageSegment]):
     @classmethod
@@ -681,11 +859,33 @@ class Message(BaseMessage[MessageSegment]):
     
     @override
     def __add__(self, other: Union[str, MessageSegment, Iterable[MessageSegment]]) -> 'Message':
-        return super().__add__(MessageSegment.text(other) if isinstance(other, str) else other).__merge_text__()
+        result = self.copy().__merge_text__()
+        for seg in Message(MessageSegment.text(other) if isinstance(other, str) else other):
+            result._append_merging(seg)
+        return result
     
     @override
     def __radd__(self, other: Union[str, MessageSegment, Iterable[MessageSegment]]) -> 'Message':
-        return super().__radd__(MessageSegment.text(other) if isinstance(other, str) else other).__merge_text__()
+        return Message(MessageSegment.text(other) if isinstance(other, str) else other) + self
+    
+    @override
+    def __str__(self) -> str:
+        parts: list[str] = []
+        self.write_to(parts.append)
+        return ''.join(parts)
+    
+    def write_to(self, write: Callable[[str], Any]) -> None:
+        '''将消息逐段写入 `write`，嵌套的子消息共用同一写入目标
+
+        参数:
+            write (Callable[[str], Any]): 写入函数，如 `list.append` 或 `IO.write`
+        '''
+        for seg in self:
+            # 无样式文本直接转义，省去消息段 `__str__` 的调用
+            if type(seg) is Text and not seg.data['styles']:
+                write(escape(seg.data['text']))
+            else:
+                seg.write_to(write)
     
     @staticmethod
     @override
@@ -694,35 +894,40 @@ class Message(BaseMessage[MessageSegment]):
     
     @classmethod
     def from_satori_element(cls, elements: list[Element]) -> 'Message':
+        '''由 satori 元素构造消息，消息段持有元素 attrs 的副本，不会修改传入的元素'''
         message = Message()
         
         for element in elements:
-            message.extend(handle(element))
+            for seg in handle(element):
+                message._append_merging(seg)
         
-        return message.__merge_text__()
+        return message
     
     @override
     def extract_plain_text(self) -> str:
-        return ''.join(seg.data['text'] for seg in self if seg.is_text())
+        if len(self) == 1 and type(self[0]) is Text:
+            return self[0].data['text']
+        return ''.join(seg.data['text'] for seg in self if type(seg) is Text or seg.is_text())
+
+    def _append_merging(self, seg: MessageSegment) -> Self:
+        '''添加消息段，若其与末尾消息段均为文本则直接合并入末尾消息段'''
+        if self and seg.type == 'text' and (last := self[-1]).type == 'text':
+            assert isinstance(last, Text)
+            _len = len(last.data['text'])
+            last.data['text'] += seg.data['text']
+            for scale, styles in seg.data['styles'].items():
+                last.data['styles'][(scale[0] + _len, scale[1] + _len)] = styles[:]
+        else:
+            self.append(seg)
+        return self
 
     def __merge_text__(self) -> Self:
-        if not self:
+        if not any(last.type == 'text' and seg.type == 'text' for last, seg in pairwise(self)):
             return self
-        result = []
-        last = self[0]
-        for seg in self[1:]:
-            if last.type == 'text' and seg.type == 'text':
-                assert isinstance(last, Text)
-                _len = len(last.data['text'])
-                last.data['text'] += seg.data['text']
-                for scale, styles in seg.data['styles'].items():
-                    last.data['styles'][(scale[0] + _len, scale[1] + _len)] = styles[:]
-            else:
-                result.append(last)
-                last = seg
-        result.append(last)
+        segments = list(self)
         self.clear()
-        self.extend(result)
+        for seg in segments:
+            self._append_merging(seg)
         return self
 
     @staticmethod
@@ -730,132 +935,13 @@ class Message(BaseMessage[MessageSegment]):
     def parse_uni_message(uni_message: uni.Message) -> 'Message':
         msg = Message()
         for seg in uni_message:
-            match seg.type:
-                case 'text':
-                    msg += MessageSegment.text(seg.text)
-                case 'at':
-                    _seg = MessageSegment.at(
-                        id=seg.data.get('id', None),
-                        name=seg.data.get('name', None),
-                        role=seg.data.get('role', None),
-                        type=seg.data.get('type', None)
-                    )
-                    _seg.data = seg.data | _seg.data # type: ignore
-                    if seg.children is not None:
-                        _seg.set_children(Message.parse_uni_message(seg.children))
-                    msg += _seg
-                case 'sharp':
-                    _seg = MessageSegment.sharp(seg.data['id'], seg.data.get('name', None))
-                    _seg.data = seg.data | _seg.data # type: ignore
-                    if seg.children is not None:
-                        _seg.set_children(Message.parse_uni_message(seg.children))
-                    msg += _seg
-                case 'link':
-                    _seg = MessageSegment.a(seg.data['href'])
-                    _seg.data = seg.data | _seg.data # type: ignore
-                    if seg.children is not None:
-                        _seg.set_children(Message.parse_uni_message(seg.children))
-                    msg += _seg
-                case 'image':
-                    _seg = MessageSegment.img(
-                        src=seg.data['src'],
-                        title=seg.data.get('title', None),
-                        cache=seg.data.get('cache', None),
-                        timeout=seg.data.get('timeout', None),
-                        width=seg.data.get('width', None),
-                        height=seg.data.get('height', None)
-                    )
-                    _seg.data = seg.data | _seg.data # type: ignore
-                    if seg.children is not None:
-                        _seg.set_children(Message.parse_uni_message(seg.children))
-                    msg += _seg
-                case 'audio':
-                    _seg = MessageSegment.audio(
-                        src=seg.data['src'],
-                        title=seg.data.get('title', None),
-                        cache=seg.data.get('cache', None),
-                        timeout=seg.data.get('timeout', None),
-                        duration=seg.data.get('duration', None),
-                        poster=seg.data.get('poster', None)
-                    )
-                    _seg.data = seg.data | _seg.data # type: ignore
-                    if seg.children is not None:
-                        _seg.set_children(Message.parse_uni_message(seg.children))
-                    msg += _seg
-                case 'video':
-                    _seg = MessageSegment.video(
-                        src=seg.data['src'],
-                        title=seg.data.get('title', None),
-                        cache=seg.data.get('cache', None),
-                        timeout=seg.data.get('timeout', None),
-                        width=seg.data.get('width', None),
-                        height=seg.data.get('height', None),
-                        duration=seg.data.get('duration', None),
-                        poster=seg.data.get('poster', None)
-                    )
-                    _seg.data = seg.data | _seg.data # type: ignore
-                    if seg.children is not None:
-                        _seg.set_children(Message.parse_uni_message(seg.children))
-                    msg += _seg
-                case 'file':
-                    _seg = MessageSegment.file(
-                        src=seg.data['src'],
-                        title=seg.data.get('title', None),
-                        cache=seg.data.get('cache', None),
-                        timeout=seg.data.get('timeout', None),
-                        poster=seg.data.get('poster', None)
-                    )
-                    _seg.data = seg.data | _seg.data # type: ignore
-                    if seg.children is not None:
-                        _seg.set_children(Message.parse_uni_message(seg.children))
-                    msg += _seg
-                case 'style':
-                    msg += Text('text', {'text': seg.text, 'styles': {(0, len(seg.text)): [seg.style]}})
-                case 'br':
-                    msg += MessageSegment.br()
-                case 'message':
-                    _seg = MessageSegment.message(
-                        id=seg.data.get('id', None),
-                        forward=seg.data.get('forward', None),
-                        message=Message.parse_uni_message(seg.children) if seg.children is not None else None
-                    )
-                    _seg.data = seg.data | _seg.data # type: ignore
-                    msg += _seg
-                case 'quote':
-                    _seg = MessageSegment.message(
-                        id=seg.data.get('id', None),
-                        forward=seg.data.get('forward', None),
-                        message=Message.parse_uni_message(seg.children) if seg.children is not None else None
-                    )
-                    _seg.data = seg.data | _seg.data # type: ignore
-                    msg += _seg
-                case 'author':
-                    _seg = MessageSegment.author(
-                        id=seg.data['id'],
-                        name=seg.data.get('name', None),
-                        avatar=seg.data.get('avatar', None)
-                    )
-                    _seg.data = seg.data | _seg.data # type: ignore
-                    if seg.children is not None:
-                        _seg.set_children(Message.parse_uni_message(seg.children))
-                    msg += _seg
-                case 'button':
-                    _seg = MessageSegment.button(
-                        id=seg.data.get('id', None),
-                        type=seg.data.get('type', None),
-                        href=seg.data.get('href', None),
-                        text=seg.data.get('text', None),
-                        theme=seg.data.get('theme', None)
-                    )
-                    _seg.data = seg.data | _seg.data # type: ignore
-                    if seg.children is not None:
-                        _seg.set_children(Message.parse_uni_message(seg.children))
-                    msg += _seg
-                case _:
-                    _seg = MessageSegment.extend(seg.type)
-                    _seg.data = seg.data.copy()
-                    if seg.children is not None:
-                        _seg.set_children(Message.parse_uni_message(seg.children))
-                    msg += _seg
+            _seg = _UNI_SEGMENT_BUILDERS.get(seg.type, _uni_extend)(seg)
+            if seg.type not in _UNI_TEXT_TYPES:
+                # 原地补全构造时未处理的数据，已构造的数据优先
+                for key, value in seg.data.items():
+                    _seg.data.setdefault(key, value)
+                if seg.children is not None:
+                    _seg.set_children(Message.parse_uni_message(seg.children))
+            msg._append_merging(_seg)
         
         return msg
@@ -10,19 +10,24 @@ from anonbot.adapter import (
     MessageModel as Message
 )
 
+def _parse_ms_timestamp(v: Any) -> Optional[datetime]:
+    '''解析毫秒时间戳，字符串等值先转换为整数'''
+    if v is None:
+        return None
+    if isinstance(v, datetime):
+        return v
+    try:
+        timestamp = int(v)
+    except ValueError as exception:
+        raise ValueError(f'Invalid timestamp: {v}') from exception
+    return datetime.fromtimestamp(timestamp / 1000)
+
 class InnerMember(Member):
     
     @field_validator('joined_at', mode='before')
+    @classmethod
     def parse_joined_at(cls, v: Any) -> Optional[datetime]:
-        if v is None:
-            return None
-        if isinstance(v, datetime):
-            return v
-        try:
-            timestamp = int(v)
-        except ValueError as exception:
-            raise ValueError(f'Invalid timestamp: {v}') from exception
-        return datetime.fromtimestamp(timestamp / 1000)
+        return _parse_ms_timestamp(v)
 
 class OuterMember(InnerMember):
     user: 'User' # type: ignore
@@ -37,31 +42,10 @@ class InnerMessage(Message):
             return values
         return {**values, 'content': ''}
     
-    @field_validator('created_at', mode='before')
+    @field_validator('created_at', 'updated_at', mode='before')
     @classmethod
-    def parse_created_at(cls, v: Any) -> Optional[datetime]:
-        if v is None:
-            return None
-        if isinstance(v, datetime):
-            return v
-        try:
-            timestamp = int(v)
-        except ValueError as exception:
-            raise ValueError(f'Invalid timestamp: {v}') from exception
-        return datetime.fromtimestamp(timestamp / 1000)
-    
-    @field_validator('updated_at', mode='before')
-    @classmethod
-    def parse_updated_at(cls, v: Any) -> Optional[datetime]:
-        if v is None:
-            return None
-        if isinstance(v, datetime):
-            return v
-        try:
-            timestamp = int(v)
-        except ValueError as exception:
-            raise ValueError(f'Invalid timestamp: {v}') from exception
-        return datetime.fromtimestamp(timestamp / 1000)
+    def parse_timestamps(cls, v: Any) -> Optional[datetime]:
+        return _parse_ms_timestamp(v)
 
 class OuterMessage(InnerMessage):
     channel: 'Channel' # type: ignore
@@ -94,14 +78,8 @@ class Event(BaseModel):
     
     @field_validator('timestamp', mode='before')
     @classmethod
-    def parse_timestamp(cls, v: Any) -> datetime:
-        if isinstance(v, datetime):
-            return v
-        try:
-            timestamp = int(v)
-        except ValueError as exception:
-            raise ValueError(f'Invalid timestamp: {v}') from exception
-        return datetime.fromtimestamp(timestamp / 1000)
+    def parse_timestamp(cls, v: Any) -> Optional[datetime]:
+        return _parse_ms_timestamp(v)
 
 class Opcode(IntEnum):
     EVENT = 0
@@ -156,3 +134,11 @@ from anonbot.adapter import (
     ChannelType as ChannelType,
     LoginStatus as LoginStatus
 )
+
+# 依赖的模型导入完成后统一解析前向引用
+for _model in (
+    InnerMember, OuterMember, InnerMessage, OuterMessage,
+    OuterLogin, Event, Ready, ReadyOperation, EventOperation
+):
+    _model.model_rebuild()
+del _model
@@ -2,13 +2,49 @@
 
 配置本身使用 YAML 文件格式'''
 
+import os
+from copy import deepcopy
 from datetime import timedelta
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Self, Union, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+_YAML_CACHE_SIZE = 100
+'''YAML 解析缓存的最大条目数'''
+_yaml_cache: OrderedDict[str, tuple[float, int, Any]] = OrderedDict()
+'''YAML 解析缓存，以绝对路径为键，值为 `(mtime, size, data)`'''
+
+def _load_yaml(path: str) -> Any:
+    '''读取 YAML 文件，文件未变动时直接复用上次的解析结果'''
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    entry = _yaml_cache.get(path)
+    if entry is not None and entry[0] == stat.st_mtime and entry[1] == stat.st_size:
+        _yaml_cache.move_to_end(path)
+        return deepcopy(entry[2])
+    # 以字节读入，交由 libyaml 自行解码
+    with open(path, 'rb') as file:
+        data = yaml.load(file, Loader=_SafeLoader)
+    _yaml_cache[path] = (stat.st_mtime, stat.st_size, data)
+    _yaml_cache.move_to_end(path)
+    if len(_yaml_cache) > _YAML_CACHE_SIZE:
+        _yaml_cache.popitem(last=False)
+    # 返回副本，避免调用方修改污染缓存
+    return deepcopy(data)
+
+_CONFIG_CACHE_SIZE = 100
+'''已校验配置缓存的最大条目数'''
+_config_cache: OrderedDict[tuple[type, str], tuple[float, int, 'BaseConfig']] = OrderedDict()
+'''已校验配置缓存，以 `(配置类, 绝对路径)` 为键，值为 `(mtime, size, config)`'''
+
 class BaseConfig(BaseSettings):
     
     model_config = SettingsConfigDict(extra='allow')
@@ -18,16 +54,36 @@ class BaseConfig(BaseSettings):
             return self.__dict__.get(name)
     
     def get(self, name: str, default: Any = None) -> Any:
-        return self.model_dump().get(name, default)
+        # 直接读取字段值，避免每次都序列化整个配置
+        if name in self.__dict__:
+            return self.__dict__[name]
+        extra = self.__pydantic_extra__
+        if extra is not None and name in extra:
+            return extra[name]
+        return default
     
     @classmethod
     def load_from_yaml(cls, path: str) -> Self:
         try:
-            with open(path, 'r', encoding='utf-8') as file:
-                data = yaml.safe_load(file)
+            stat = os.stat(path)
+        except OSError:
+            return cls.model_validate({})
+        key = (cls, os.path.abspath(path))
+        cached = _config_cache.get(key)
+        if cached is not None and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+            # 文件未变动时复制已校验的实例，跳过解析与校验
+            _config_cache.move_to_end(key)
+            return cached[2].model_copy(deep=True) # type: ignore
+        try:
+            data = _load_yaml(path)
         except Exception:
-            data = {}
-        return cls.model_validate(data)
+            return cls.model_validate({})
+        config = cls.model_validate(data)
+        _config_cache[key] = (stat.st_mtime, stat.st_size, config)
+        _config_cache.move_to_end(key)
+        if len(_config_cache) > _CONFIG_CACHE_SIZE:
+            _config_cache.popitem(last=False)
+        return config.model_copy(deep=True)
 
 class Config(BaseConfig):
     log_level: Union[int, str] = 'INFO'
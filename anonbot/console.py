@@ -3,11 +3,25 @@
 此模块包含了通过控制台控制 AnonBot 的相关函数，如插件管理等
 '''
 
+import os
+import re
+import codecs
 import sys
+import select
 import signal
 import importlib
-from pkgutil import iter_modules
-from typing import TYPE_CHECKING, Optional
+from threading import Lock, Event, current_thread
+from pkgutil import iter_importer_modules
+from importlib.machinery import (
+    FileFinder,
+    SOURCE_SUFFIXES,
+    BYTECODE_SUFFIXES,
+    EXTENSION_SUFFIXES,
+    SourceFileLoader,
+    ExtensionFileLoader,
+    SourcelessFileLoader
+)
+from typing import TYPE_CHECKING, Callable, Optional
 
 from anonbot.log import logger
 from anonbot.rule import TrieRule, CommandRule
@@ -27,6 +41,11 @@ if TYPE_CHECKING:
 
 _driver: Optional['Driver'] = None
 
+_discovered: dict[str, tuple[float, list[str]]] = {}
+'''插件搜索结果，以目录绝对路径为键，值为 `(目录修改时间, 模块名列表)`'''
+_discovered_lock = Lock()
+'''搜索结果的读写锁'''
+
 def _unload_plugin(name: str) -> None:
     '''卸载插件
 
@@ -130,153 +149,222 @@ def _reload_plugin(name: str) -> None:
     logger.info(f'Plugin {name} reloaded', name='console')
     return
 
+_LOADER_DETAILS = (
+    (ExtensionFileLoader, EXTENSION_SUFFIXES),
+    (SourceFileLoader, SOURCE_SUFFIXES),
+    (SourcelessFileLoader, BYTECODE_SUFFIXES)
+)
+'''搜索插件时查找器支持的加载器与文件后缀，与默认的路径钩子一致'''
+
 def _search_plugins(path: str) -> list[str]:
     '''从路径中搜索插件
 
     参数:
         path (str): 搜索路径
     '''
-    result: list[str] = []
-    for module_info in iter_modules([path]):
-        if module_info.name.startswith('_'):
-            continue
-        
-        if module_info.name in result:
-            continue
-        
-        if not (module_spec := module_info.module_finder.find_spec(module_info.name, None)):
-            continue
-        
-        if not module_spec.origin:
-            continue
-        result.append(module_info.name)
-    return result
-
-@loop
-def _console() -> None:
-    cmd = ''
+    path = os.path.abspath(path)
     try:
-        cmd = input('AnonBot> ')
-    except KeyboardInterrupt:
-        if _driver is not None:
-            _driver._handle_exit(signal.SIGINT, None)
-        else:
-            sys.exit(0)
-    if cmd == '':
-        return
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return []
+    with _discovered_lock:
+        # 目录内容未变动时直接复用上次的搜索结果
+        if (cached := _discovered.get(path)) is not None and cached[0] == mtime:
+            return list(cached[1])
     
-    if cmd.startswith('plugins'):
-        if cmd.lstrip('plugins').strip() == '':
-            for plugin in get_loaded_plugins():
-                print(plugin.name)
-        else:
-            if cmd.lstrip('plugins').strip() == 'help':
-                print(
-                    'plugins: 列出已加载的插件'
-                )
-            else:
-                print(
-                    '"plugins" command does not accept any arguments, \n'
-                    'use "help" command to get help'
-                )
-    elif cmd.startswith('search'):
-        path_name = cmd.lstrip('search').strip()
-        if path_name == '':
-            print(
-                '"search" command requires a path name, \n'
-                'use "help" command to get help'
-            )
-        elif path_name == 'help':
-            print(
-                'search <path_name>: 搜索指定路径中的可用插件'
-            )
-        else:
-            result = _search_plugins(path_name)
-            if not result:
-                print(f'No loadable plugin found in path {path_name}')
-            else:
-                print('Loadable plugins:')
-                for plugin in result:
-                    print('-', plugin)
-    elif cmd.startswith('load'):
-        plugin_name = cmd.lstrip('load').strip()
-        if plugin_name == '':
-            print(
-                '"load" command requires a plugin name with path, \n'
-                'use "help" command to get help'
-            )
-        elif plugin_name == 'help':
-            print(
-                'load <path_name.plugin_name>: 加载指定路径插件'
-            )
+    if not os.path.isdir(path):
+        return []
+    # 直接创建查找器，不经 `get_importer` 写入 `sys.path_importer_cache` 而影响后续导入
+    importer = FileFinder(path, *_LOADER_DETAILS)
+    # `iter_importer_modules` 只会给出可导入的模块文件与含 `__init__` 的包且已去重，
+    # 无需再逐个 `find_spec` 确认来源
+    names = [name for name, _ in iter_importer_modules(importer) if not name.startswith('_')]
+    with _discovered_lock:
+        _discovered[path] = (mtime, names)
+    return list(names)
+
+def _cmd_plugins(arg: str) -> None:
+    if arg == '':
+        for plugin in get_loaded_plugins():
+            print(plugin.name)
+    elif arg == 'help':
+        print(
+            'plugins: 列出已加载的插件'
+        )
+    else:
+        print(
+            '"plugins" command does not accept any arguments, \n'
+            'use "help" command to get help'
+        )
+
+def _cmd_search(path_name: str) -> None:
+    if path_name == '':
+        print(
+            '"search" command requires a path name, \n'
+            'use "help" command to get help'
+        )
+    elif path_name == 'help':
+        print(
+            'search <path_name>: 搜索指定路径中的可用插件'
+        )
+    else:
+        result = _search_plugins(path_name)
+        if not result:
+            print(f'No loadable plugin found in path {path_name}')
         else:
-            _load_plugin(plugin_name)
-    elif cmd.startswith('unload'):
-        plugin_name = cmd.lstrip('unload').strip()
-        if plugin_name == '':
-            print(
-                '"unload" command requires a plugin name, \n'
-                'use "help" command to get help'
-            )
-        elif plugin_name == 'help':
-            print(
-                'unload <plugin_name>: 卸载指定插件'
-            )
+            print('Loadable plugins:')
+            for plugin in result:
+                print('-', plugin)
+
+def _cmd_load(plugin_name: str) -> None:
+    if plugin_name == '':
+        print(
+            '"load" command requires a plugin name with path, \n'
+            'use "help" command to get help'
+        )
+    elif plugin_name == 'help':
+        print(
+            'load <path_name.plugin_name>: 加载指定路径插件'
+        )
+    else:
+        _load_plugin(plugin_name)
+
+def _cmd_unload(plugin_name: str) -> None:
+    if plugin_name == '':
+        print(
+            '"unload" command requires a plugin name, \n'
+            'use "help" command to get help'
+        )
+    elif plugin_name == 'help':
+        print(
+            'unload <plugin_name>: 卸载指定插件'
+        )
+    else:
+        plugin = get_plugin(plugin_name)
+        if plugin is None:
+            print(f'Plugin {plugin_name} not found, please check the name')
         else:
-            plugin = get_plugin(plugin_name)
-            if plugin is None:
-                print(f'Plugin {plugin_name} not found, please check the name')
-            else:
-                _unload_plugin(plugin.name)
-    elif cmd.startswith('reload'):
-        plugin_name = cmd.lstrip('reload').strip()
-        if plugin_name == '':
-            print(
-                '"reload" command requires a plugin name, \n'
-                'use "help" command to get help'
-            )
-        elif plugin_name == 'help':
-            print(
-                'reload <plugin_name>: 重载指定插件'
-            )
+            _unload_plugin(plugin.name)
+
+def _cmd_reload(plugin_name: str) -> None:
+    if plugin_name == '':
+        print(
+            '"reload" command requires a plugin name, \n'
+            'use "help" command to get help'
+        )
+    elif plugin_name == 'help':
+        print(
+            'reload <plugin_name>: 重载指定插件'
+        )
+    else:
+        plugin = get_plugin(plugin_name)
+        if plugin is None:
+            print(f'Plugin {plugin_name} not found, please check the name')
         else:
-            plugin = get_plugin(plugin_name)
-            if plugin is None:
-                print(f'Plugin {plugin_name} not found, please check the name')
-            else:
-                _reload_plugin(plugin.name)
-    elif cmd.startswith('exit'):
-        if cmd.lstrip('exit').strip() == '':
-            if _driver is not None:
-                _driver._handle_exit(signal.SIGINT, None)
-            else:
-                sys.exit(0)
+            _reload_plugin(plugin.name)
+
+def _cmd_exit(arg: str) -> None:
+    if arg == '':
+        if _driver is not None:
+            _driver._handle_exit(signal.SIGINT, None)
         else:
-            if cmd.lstrip('exit').strip() == 'help':
-                print(
-                    'exit: 退出控制台'
-                )
-            else:
-                print(
-                    '"exit" command does not accept any arguments, \n'
-                    'use "help" command to get help\n'
-                )
-    elif cmd.startswith('help'):
+            sys.exit(0)
+    elif arg == 'help':
         print(
-            'AnonBot 控制台命令列表\n'
-            '    help: 获取帮助\n'
-            '    plugins: 列出已加载的插件\n'
-            '    search <path_name>: 搜索指定路径中的可用插件\n'
-            '    load <path_name.plugin_name>: 加载指定路径插件\n'
-            '    unload <plugin_name>: 卸载指定插件\n'
-            '    reload <plugin_name>: 重载指定插件\n'
-            '    exit: 退出 AnonBot\n'
+            'exit: 退出控制台'
         )
     else:
+        print(
+            '"exit" command does not accept any arguments, \n'
+            'use "help" command to get help\n'
+        )
+
+def _cmd_help(arg: str) -> None:
+    print(
+        'AnonBot 控制台命令列表\n'
+        '    help: 获取帮助\n'
+        '    plugins: 列出已加载的插件\n'
+        '    search <path_name>: 搜索指定路径中的可用插件\n'
+        '    load <path_name.plugin_name>: 加载指定路径插件\n'
+        '    unload <plugin_name>: 卸载指定插件\n'
+        '    reload <plugin_name>: 重载指定插件\n'
+        '    exit: 退出 AnonBot\n'
+    )
+
+_COMMANDS: dict[str, Callable[[str], None]] = {
+    'plugins': _cmd_plugins,
+    'search': _cmd_search,
+    'load': _cmd_load,
+    'unload': _cmd_unload,
+    'reload': _cmd_reload,
+    'exit': _cmd_exit,
+    'help': _cmd_help
+}
+'''控制台命令表，键为命令名，值为以命令参数调用的处理函数'''
+
+_ANSI_ESCAPE_PAT = re.compile(r'\x1b\[[0-9;?]*[A-Za-z]')
+'''终端光标控制等 ANSI 转义序列'''
+_POLL_INTERVAL = 0.1
+'''等待输入时轮询标准输入的间隔'''
+_input_buffer = ''
+'''已读入但尚未处理的输入，粘贴多行时后续行暂存于此'''
+_input_decoder: Optional[codecs.IncrementalDecoder] = None
+'''标准输入增量解码器，避免多字节字符被读取边界截断'''
+
+def _read_line(prompt: str) -> Optional[str]:
+    '''读取一行控制台输入
+
+    在支持 `select` 轮询标准输入的平台上，等待期间会检查线程的取消信号，
+    线程被取消时返回 `None`；其余情况回退到 `input`
+
+    参数:
+        prompt (str): 输入提示
+    '''
+    global _input_buffer, _input_decoder
+    if os.name == 'nt':
+        return input(prompt)
+    try:
+        fd = sys.stdin.fileno()
+    except (AttributeError, ValueError, OSError):
+        return input(prompt)
+    if _input_decoder is None:
+        _input_decoder = codecs.getincrementaldecoder(sys.stdin.encoding or 'utf-8')(errors='replace')
+    
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    _signal: Optional[Event] = getattr(current_thread(), '__stop_signal', None)
+    # 直接读取文件描述符并自行分行，避免 `sys.stdin` 的缓冲区中残留的行无法被 `select` 察觉
+    while '\n' not in _input_buffer:
+        if not select.select([fd], [], [], _POLL_INTERVAL)[0]:
+            if _signal is not None and _signal.is_set():
+                return None
+            continue
+        chunk = os.read(fd, 4096)
+        if not chunk:
+            if not _input_buffer:
+                raise EOFError
+            _input_buffer += '\n'
+            break
+        _input_buffer += _input_decoder.decode(chunk)
+    line, _, _input_buffer = _input_buffer.partition('\n')
+    return _ANSI_ESCAPE_PAT.sub('', line.rstrip('\r'))
+
+@loop
+def _console() -> None:
+    # 控制台运行于工作线程，SIGINT 由驱动器在主线程安装的处理函数响应
+    cmd = _read_line('AnonBot> ')
+    if cmd is None or not cmd.strip():
+        return
+    
+    # 按首个空白切分命令名与参数，查表分发
+    name, *args = cmd.split(maxsplit=1)
+    if (handler := _COMMANDS.get(name)) is None:
         print(
             f'Command {cmd} is not an available command\n'
             'use "help" command to get help'
         )
+        return
+    handler(args[0].strip() if args else '')
 
 def run(driver: 'Driver') -> None:
     '''启动控制台'''
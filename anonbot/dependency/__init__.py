@@ -2,6 +2,7 @@
 
 import abc
 import inspect
+from weakref import WeakValueDictionary
 from dataclasses import field, dataclass
 from typing import (
     Any,
@@ -9,10 +10,8 @@ from typing import (
     Tuple,
     Generic,
     TypeVar,
-    Callable,
     Iterable,
-    Optional,
-    cast
+    Optional
 )
 
 from anonbot.log import logger
@@ -51,6 +50,14 @@ class Param(abc.ABC, FieldInfo):
     ) -> Optional['Param']:
         return
     
+    @classmethod
+    def _claimed_annotations(cls) -> Tuple[Any, ...]:
+        '''参数无默认值时，注解恰为其中之一即由该类型认领，可跳过逐个类型的探测
+
+        如需引用可能产生循环导入的类型，应在方法内局部导入
+        '''
+        return ()
+    
     @abc.abstractmethod
     def _solve(self, **kwargs: Any) -> Any:
         raise NotImplementedError
@@ -58,6 +65,34 @@ class Param(abc.ABC, FieldInfo):
     def _check(self, **kwargs: Any) -> None:
         return
 
+_fast_dispatches: dict[Tuple[Type[Param], ...], dict[Any, Type[Param]]] = {}
+'''各参数类型组合对应的注解到参数类型的映射'''
+
+def _get_fast_dispatch(allow_types: Tuple[Type[Param], ...]) -> dict[Any, Type[Param]]:
+    '''由参数类型声明的认领注解构建注解到参数类型的映射，靠前的类型优先'''
+    if (dispatch := _fast_dispatches.get(allow_types)) is not None:
+        return dispatch
+    dispatch = {}
+    for allow_type in allow_types:
+        for annotation in allow_type._claimed_annotations():
+            dispatch.setdefault(annotation, allow_type)
+    _fast_dispatches[allow_types] = dispatch
+    return dispatch
+
+def _lookup_dispatch(dispatch: dict[Any, Type[Param]], annotation: Any) -> Optional[Type[Param]]:
+    try:
+        return dispatch.get(annotation)
+    except TypeError:
+        # 含不可哈希元数据的注解无法查表
+        return None
+
+def _probe_param(param: inspect.Parameter, allow_types: Tuple[Type[Param], ...]) -> Optional[Param]:
+    '''依次以各参数类型探测参数，返回首个匹配结果'''
+    for allow_type in allow_types:
+        if field_info := allow_type._check_param(param, allow_types):
+            return field_info
+    return None
+
 @dataclass(frozen=True)
 class Dependent(Generic[R]):
     '''依赖注入容器'''
@@ -82,7 +117,7 @@ class Dependent(Generic[R]):
             self.check(**kwargs)
             
             values = self.solve(**kwargs)
-            return cast(Callable[..., R], self.call)(**values)
+            return self.call(**values) # type: ignore
         except SkippedException as e:
             logger.trace(f'Skipped {self} with {e}')
             raise
@@ -93,19 +128,25 @@ class Dependent(Generic[R]):
     ):
         fields: list[ParameterField] = []
         params = get_typed_signature(call).parameters.values()
+        dispatch = _get_fast_dispatch(allow_types)
         
         for param in params:
             if isinstance(param.default, Param):
                 field_info = param.default
+            elif (
+                param.default is param.empty
+                and (fast_type := _lookup_dispatch(dispatch, param.annotation)) is not None
+                and (fast_info := fast_type._check_param(param, allow_types))
+            ):
+                field_info = fast_info
             else:
-                for allow_type in allow_types:
-                    if field_info := allow_type._check_param(param, allow_types):
-                        break
-                else:
+                resolved = _probe_param(param, allow_types)
+                if resolved is None:
                     raise ValueError(
                         f'Unknown parameter {param.name} '
                         f'for function {call} with type {param.annotation}'
                     )
+                field_info = resolved
             
             annotation: Any = Any
             if param.annotation is not param.empty:
@@ -144,21 +185,43 @@ class Dependent(Generic[R]):
         allow_types: Iterable[Type[Param]]
     ) -> 'Dependent[R]':
         allow_types = tuple(allow_types)
+        if parameterless is not None:
+            parameterless = tuple(parameterless)
+        
+        key: Optional[tuple[Any, ...]] = (cls, call, parameterless, allow_types)
+        try:
+            if (dependent := _parse_cache.get(key)) is not None:
+                return dependent
+        except TypeError:
+            # 含不可哈希对象时不经过缓存
+            key = None
         
         params = cls.parse_params(call, allow_types)
         parameterless_params = (
             () if parameterless is None
-            else cls.parse_parameterless(tuple(parameterless), allow_types)
+            else cls.parse_parameterless(parameterless, allow_types)
         )
         
-        return cls(call, params, parameterless_params)
+        dependent = cls(call, params, parameterless_params)
+        if key is not None:
+            _parse_cache[key] = dependent
+        return dependent
     
     def check(self, **params: Any) -> None:
-        gather(*(Task(param._check, **params) for param in self.parameterless))
-        gather(*(Task(cast(Param, param.field_info)._check, **params) for param in self.params))
+        # 至多一项时直接执行，省去创建任务与线程池调度的开销
+        if len(self.parameterless) > 1:
+            gather(*(Task(param._check, **params) for param in self.parameterless))
+        else:
+            for param in self.parameterless:
+                param._check(**params)
+        if len(self.params) > 1:
+            gather(*(Task(param.field_info._check, **params) for param in self.params)) # type: ignore
+        else:
+            for param in self.params:
+                param.field_info._check(**params) # type: ignore
     
     def _solve_field(self, field: ParameterField, params: dict[str, Any]) -> Any:
-        param = cast(Param, field.field_info)
+        param: Param = field.field_info # type: ignore
         value = param._solve(**params)
         if value is PydanticUndefined:
             value = field.get_default()
@@ -169,5 +232,11 @@ class Dependent(Generic[R]):
         for param in self.parameterless:
             param._solve(**params)
         
-        values = gather(*(Task(self._solve_field, field, params) for field in self.params))
+        if len(self.params) > 1:
+            values = gather(*(Task(self._solve_field, field, params) for field in self.params))
+        else:
+            values = [self._solve_field(field, params) for field in self.params]
         return {field.name: value for field, value in zip(self.params, values)}
+
+_parse_cache: 'WeakValueDictionary[tuple[Any, ...], Dependent[Any]]' = WeakValueDictionary()
+'''依赖解析缓存，`Dependent` 不可变故可在重复注册间共用，无人引用时自动移除'''
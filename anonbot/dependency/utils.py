@@ -1,6 +1,7 @@
 import inspect
+from functools import lru_cache
 from contextlib import suppress
-from dataclasses import dataclass, is_dataclass
+from dataclasses import field, dataclass, is_dataclass
 from typing import (
     Any,
     Self,
@@ -38,13 +39,15 @@ class FieldInfo(BaseFieldInfo):
         slots = super().__slots__
         return {k: v for k, v in self._attributes_set.items() if k not in slots}
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class ParameterField:
     '''参数字段'''
     
     name: str
     annotation: Any
     field_info: FieldInfo
+    _type_adapter: Optional[TypeAdapter[Any]] = field(default=None, init=False, repr=False, compare=False)
+    '''字段类型校验器，首次校验时构建'''
     
     @classmethod
     def _construct(cls, name: str, annotation: Any, field_info: FieldInfo) -> Self:
@@ -79,6 +82,15 @@ class ParameterField:
     
     def get_default(self) -> Any:
         return self.field_info.get_default(call_default_factory=True)
+    
+    def get_type_adapter(self) -> TypeAdapter[Any]:
+        '''获取字段类型校验器，构建后缓存于字段上'''
+        if self._type_adapter is None:
+            _type: Any = Annotated[self.annotation, self.field_info]
+            self._type_adapter = TypeAdapter(
+                _type, config=None if self._annotation_has_config() else DEFAULT_CONFIG
+            )
+        return self._type_adapter
 
 def extract_field_info(field_info: BaseFieldInfo) -> dict[str, Any]:
     kwargs = field_info._attributes_set.copy()
@@ -88,6 +100,13 @@ def extract_field_info(field_info: BaseFieldInfo) -> dict[str, Any]:
 def get_typed_signature(call: Callable[..., Any]) -> inspect.Signature:
     '''获取可调用对象签名'''
     
+    try:
+        return _get_typed_signature_cached(call)
+    except TypeError:
+        # 不可哈希的可调用对象不经过缓存
+        return _get_typed_signature(call)
+
+def _get_typed_signature(call: Callable[..., Any]) -> inspect.Signature:
     signature = inspect.signature(call)
     globalns = getattr(call, '__globals__', {})
     typed_params = [
@@ -101,6 +120,9 @@ def get_typed_signature(call: Callable[..., Any]) -> inspect.Signature:
     ]
     return inspect.Signature(typed_params)
 
+_get_typed_signature_cached = lru_cache(maxsize=4096)(_get_typed_signature)
+'''带缓存的签名解析，处理器定义后签名不再变化'''
+
 def get_typed_annotation(param: inspect.Parameter, globalns: dict[str, Any]) -> Any:
     """获取参数的类型注解"""
 
@@ -120,7 +142,6 @@ def check_field_type(field: ParameterField, value: Any) -> Any:
     '''检查字段类型是否匹配'''
     
     try:
-        _type: Any = Annotated[field.annotation, field.field_info]
-        return TypeAdapter(_type, config=None if field._annotation_has_config() else DEFAULT_CONFIG).validate_python(value)
+        return field.get_type_adapter().validate_python(value)
     except ValueError:
         raise TypeMisMatch(field, value)
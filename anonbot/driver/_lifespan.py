@@ -1,35 +1,51 @@
 from typing import Any, Callable, TypeAlias
 
+from anonbot import threading
+
 LIFESPAN_FUNC: TypeAlias = Callable[[], Any]
 
 class Lifespan:
     def __init__(self) -> None:
         self._startup_funcs: list[LIFESPAN_FUNC] = []
+        self._startup_concurrent_funcs: list[LIFESPAN_FUNC] = []
         self._shutdown_funcs: list[LIFESPAN_FUNC] = []
+        self._shutdown_concurrent_funcs: list[LIFESPAN_FUNC] = []
     
-    def on_startup(self, func: LIFESPAN_FUNC) -> LIFESPAN_FUNC:
-        self._startup_funcs.append(func)
+    def on_startup(self, func: LIFESPAN_FUNC, *, concurrent: bool = False) -> LIFESPAN_FUNC:
+        (self._startup_concurrent_funcs if concurrent else self._startup_funcs).append(func)
         return func
     
-    def on_shutdown(self, func: LIFESPAN_FUNC) -> LIFESPAN_FUNC:
-        self._shutdown_funcs.append(func)
+    def on_shutdown(self, func: LIFESPAN_FUNC, *, concurrent: bool = False) -> LIFESPAN_FUNC:
+        (self._shutdown_concurrent_funcs if concurrent else self._shutdown_funcs).append(func)
         return func
     
     @staticmethod
-    def _run_func(funcs: list[LIFESPAN_FUNC]) -> None:
+    def _run_func(funcs: list[LIFESPAN_FUNC], concurrent_funcs: list[LIFESPAN_FUNC]) -> None:
+        '''先并发执行声明为可并发的函数，待其全部完成后再在当前线程按注册顺序依次执行其余函数
+
+        任一函数抛出异常时中止后续执行并向上抛出
+        '''
+        if len(concurrent_funcs) > 1:
+            results = threading.gather(
+                *(threading.Task(func) for func in concurrent_funcs), return_exceptions=True
+            )
+            # 等待全部并发函数结束后再抛出首个异常
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        else:
+            funcs = concurrent_funcs + funcs
         for func in funcs:
             func()
     
     def startup(self) -> None:
-        if self._startup_funcs:
-            self._run_func(self._startup_funcs)
+        self._run_func(self._startup_funcs, self._startup_concurrent_funcs)
     
     def shutdown(self) -> None:
-        if self._shutdown_funcs:
-            self._run_func(self._shutdown_funcs)
+        self._run_func(self._shutdown_funcs, self._shutdown_concurrent_funcs)
     
     def __enter__(self) -> None:
         self.startup()
     
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        self.shutdown()
\ No newline at end of file
+        self.shutdown()
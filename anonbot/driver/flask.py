@@ -1,22 +1,96 @@
 '''flask 驱动适配'''
 
+import os
+import shutil
 import logging
+from tempfile import SpooledTemporaryFile
 from typing_extensions import override
-from typing import Any, Tuple, Optional
+from typing import IO, Any, Tuple, Optional
 
 from anonbot.driver import Request
+from anonbot.driver import HTTPVersion
 from anonbot.driver import WSGIMixin
 from anonbot.log import LoggingHandler
 from anonbot.driver import HTTPServerSetup
-from anonbot.internal.driver import FileTypes
+from anonbot.internal.driver import FileType
 
 from flask import request, Flask, Response
-from werkzeug.datastructures import FileStorage
+from flask import Request as WerkzeugRequest
 from waitress import serve
 
 logger = logging.Logger('websocket.client', 'INFO')
 logger.addHandler(LoggingHandler())
 
+_waitress_logger = logging.getLogger('waitress')
+if not any(isinstance(handler, LoggingHandler) for handler in _waitress_logger.handlers):
+    _waitress_logger.addHandler(LoggingHandler())
+
+_SPOOL_MAX_SIZE = 500 * 1024
+'''上传文件保留在内存中的最大字节数，超出后写入临时文件'''
+
+_FORM_MIMETYPES = frozenset(('multipart/form-data', 'application/x-www-form-urlencoded'))
+'''含表单字段或文件的请求内容类型'''
+
+def _parse_version(protocol: str) -> HTTPVersion:
+    '''解析 `SERVER_PROTOCOL` 中的 HTTP 版本'''
+    version = protocol.removeprefix('HTTP/')
+    if version.startswith('2'):
+        return HTTPVersion.H2
+    try:
+        return HTTPVersion(version)
+    except ValueError:
+        return HTTPVersion.H11
+
+def _spool_file(stream: IO[bytes]) -> IO[bytes]:
+    '''将上传文件复制到临时文件，较小的文件保留在内存中'''
+    spooled = SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
+    shutil.copyfileobj(stream, spooled)
+    spooled.seek(0)
+    return spooled  # type: ignore[return-value]
+
+class RequestView(Request):
+    '''Flask 请求视图
+
+    构造时即复制请求的全部数据而不持有 Werkzeug 请求对象，
+    处理函数离开请求上下文后仍可使用。
+
+    参数:
+        request (flask.Request): 当前的 Werkzeug 请求对象
+    '''
+    def __init__(self, request: WerkzeugRequest) -> None:
+        # `request.data` 会先解析表单，表单请求的原始请求体此时为空
+        content = request.data
+        json: Any = None
+        try:
+            json = request.get_json()
+        except:
+            json = None
+        data: Optional[dict] = {}
+        files: Optional[list[Tuple[str, FileType]]] = None
+        # 非表单请求不含表单字段与文件，无需触发解析
+        if request.mimetype in _FORM_MIMETYPES:
+            try:
+                data = request.form.to_dict()
+                # 文件在请求上下文结束时即被关闭，需提前复制
+                files = [
+                    (key, (value.filename, _spool_file(value.stream), value.content_type))
+                    for key, value in request.files.items(multi=True)
+                ] or None
+            except:
+                data = None
+                files = None
+        super().__init__(
+            request.method,
+            request.url,
+            headers=list(request.headers.items()),
+            cookies=request.cookies,
+            content=content,
+            data=data,
+            json=json,
+            files=files,
+            version=_parse_version(request.environ.get('SERVER_PROTOCOL', 'HTTP/1.1'))
+        )
+
 class Mixin(WSGIMixin):
     '''flask 混入驱动适配'''
     
@@ -63,9 +137,8 @@ class Mixin(WSGIMixin):
         **kwargs: Any
     ) -> None:
         '''使用 `waitress` 启动 Flask'''
-        logger = logging.getLogger('waitress')
-        logger.addHandler(LoggingHandler())
-        
+        # 按 CPU 数量设置工作线程数，未指定时 waitress 固定使用 4 个线程
+        kwargs.setdefault('threads', max(4, os.cpu_count() or 4))
         serve(
             app or self.server_app,
             host=host,
@@ -74,41 +147,7 @@ class Mixin(WSGIMixin):
         )
     
     def _handle_http(self, setup: HTTPServerSetup) -> Response:
-        json: Any = None
-        try:
-            json = request.get_json()
-        except:
-            json = None
-        
-        data: Optional[dict] = None
-        files: Optional[list[Tuple[str, FileTypes]]] = None
-        try:
-            data = {}
-            files = []
-            for key, value in request.files.items():
-                if isinstance(value, FileStorage):
-                    files.append(
-                        (key, (value.filename, value.stream, value.content_type))
-                    )
-                else:
-                    data[key] = value
-            for key, value in request.form.items():
-                data[key] = value
-        except:
-            data = None
-            files = None
-        
-        http_request = Request(
-            request.method,
-            str(request.url),
-            headers=list(request.headers.items()),
-            cookies=request.cookies,
-            content=request.data,
-            data=data,
-            json=json,
-            files=files,
-            version=request.environ.get('SERVER_PROTOCOL', 'HTTP/1.1'),
-        )
+        http_request = RequestView(request._get_current_object())  # type: ignore[attr-defined]
         
         response = setup.handle_func(http_request)
         return Response(
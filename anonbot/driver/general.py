@@ -1,7 +1,6 @@
 '''总驱动器'''
 
 import signal
-from time import sleep
 from typing_extensions import override
 
 from anonbot import console
@@ -20,6 +19,9 @@ HANDLED_SIGNALS = (
 if WINDOWS: # pragma: py-win32
     HANDLED_SIGNALS += (signal.SIGBREAK,)
 
+SIGNAL_CHECK_INTERVAL = 0.1
+'''需要定期返回主线程以响应信号时的等待间隔'''
+
 class Driver(BaseDriver):
     '''总驱动器'''
     
@@ -37,12 +39,12 @@ class Driver(BaseDriver):
         return 'general'
     
     @override
-    def on_startup(self, func: LIFESPAN_FUNC) -> LIFESPAN_FUNC:
-        return self._lifespan.on_startup(func)
+    def on_startup(self, func: LIFESPAN_FUNC, *, concurrent: bool = False) -> LIFESPAN_FUNC:
+        return self._lifespan.on_startup(func, concurrent=concurrent)
     
     @override
-    def on_shutdown(self, func: LIFESPAN_FUNC) -> LIFESPAN_FUNC:
-        return self._lifespan.on_shutdown(func)
+    def on_shutdown(self, func: LIFESPAN_FUNC, *, concurrent: bool = False) -> LIFESPAN_FUNC:
+        return self._lifespan.on_shutdown(func, concurrent=concurrent)
     
     @override
     def run(self, *args, **kwargs) -> None:
@@ -68,8 +70,13 @@ class Driver(BaseDriver):
         console.run(self)
     
     def _main_thread(self) -> None:
-        while not self.should_exit.is_set():
-            sleep(0.1)
+        if not WINDOWS:
+            # 退出信号设置后立即唤醒，无需轮询
+            self.should_exit.wait()
+            return
+        # Windows 下无超时的等待无法被 Ctrl+C 打断
+        while not self.should_exit.wait(SIGNAL_CHECK_INTERVAL):
+            continue
     
     def _shutdown(self) -> None:
         logger.info('应用退出中...')
@@ -79,24 +86,18 @@ class Driver(BaseDriver):
         except Exception as exception:
             logger.error('Lifespan 退出失败', exception=exception)
         
-        for task in threading.all_tasks():
-            if not task.done():
-                task.cancel()
-        sleep(0.1)
-        
-        tasks = threading.all_tasks()
-        if tasks and not self.force_exit:
+        executor = threading.get_pool_executor()
+        executor.cancel_all()
+        # 给予任务短暂的自行结束时间，全部完成时立即返回
+        if not executor.wait_all_tasks(0.1) and not self.force_exit:
             logger.info('正在等待所有任务完成... (Ctrl+C 可强制退出)')
-        while tasks and not self.force_exit:
-            sleep(0.1)
-            tasks = threading.all_tasks()
-        
-        for task in tasks:
-            task.cancel(True)
+        # 任务集合清空时即被唤醒，超时仅用于响应强制退出
+        while not self.force_exit and not executor.wait_all_tasks(SIGNAL_CHECK_INTERVAL):
+            continue
         
+        # 强制取消剩余任务并停止线程池
+        executor.stop(cancel_pending=True)
         logger.info('应用退出成功')
-        executor = threading.get_pool_executor()
-        executor.stop()
     
     def _install_signal_handlers(self) -> None:
         if threading.current_thread() is not threading.main_thread():
@@ -107,7 +108,11 @@ class Driver(BaseDriver):
     
     def _handle_exit(self, sig: int, frame: object) -> None:
         '''处理退出信号'''
-        self.exit(force=self.should_exit.is_set())
+        # 第二次收到信号时强制退出
+        force = self.should_exit.is_set()
+        self.should_exit.set()
+        if force:
+            self.force_exit = True
     
     def exit(self, force: bool = False) -> None:
         '''退出总驱动
@@ -1,8 +1,13 @@
 '''httpx 驱动适配'''
 
+from threading import Lock
+from contextlib import suppress
+from typing import Any, Union, Optional
 from typing_extensions import override
+from http.cookiejar import Cookie, CookieJar, DefaultCookiePolicy
 
 from anonbot.driver import (
+    Driver,
     Request,
     Response,
     HTTPVersion,
@@ -11,42 +16,100 @@ from anonbot.driver import (
 
 import httpx
 
+_TEXT_CONTENT_TYPES = ('text/', 'application/json')
+'''按文本解码的响应内容类型前缀'''
+
+def _is_text_content_type(content_type: str) -> bool:
+    '''响应内容类型是否为文本'''
+    content_type = content_type.lower()
+    return content_type.startswith(_TEXT_CONTENT_TYPES) or 'charset=' in content_type
+
+class _RejectCookiePolicy(DefaultCookiePolicy):
+    '''拒绝保存任何响应 Cookie 的策略，使共享的客户端不在请求之间累积 Cookie'''
+    
+    @override
+    def set_ok(self, cookie: Cookie, request: Any) -> bool:
+        return False
+
 class Mixin(HTTPClientMixin):
     '''httpx 混入驱动适配'''
     
+    _clients: dict[tuple[bool, Any], httpx.Client]
+    '''按 `(是否 HTTP/2, 代理)` 复用的客户端，连接池在请求之间保持'''
+    _clients_lock = Lock()
+    '''客户端创建锁'''
+    
     @property
     @override
     def type(self) -> str:
         return 'httpx'
     
+    def _get_client(self, setup: Request) -> httpx.Client:
+        '''获取与请求配置对应的共享客户端，不存在时创建'''
+        # 组合驱动器不会调用混入类的 `__init__`，故在此惰性初始化
+        key = (setup.version == HTTPVersion.H2, setup.proxy)
+        clients: Optional[dict[tuple[bool, Any], httpx.Client]] = self.__dict__.get('_clients')
+        if clients is not None and (client := clients.get(key)) is not None:
+            return client
+        with self._clients_lock:
+            if clients is None:
+                clients = self.__dict__.setdefault('_clients', {})
+                if isinstance(self, Driver):
+                    # 首次请求时才注册，按注册顺序晚于适配器的退出函数执行
+                    self.on_shutdown(self._close_clients)
+            if (client := clients.get(key)) is None:
+                client = clients[key] = httpx.Client(
+                    cookies=CookieJar(policy=_RejectCookiePolicy()),
+                    http2=key[0],
+                    proxies=setup.proxy
+                )
+            return client
+    
+    def _close_clients(self) -> None:
+        '''关闭所有共享客户端'''
+        with self._clients_lock:
+            clients: dict[tuple[bool, Any], httpx.Client] = self.__dict__.pop('_clients', {})
+        for client in clients.values():
+            client.close()
+    
     @override
     def request(self, setup: Request) -> Response:
-        with httpx.Client(
-            cookies=setup.cookies.jar,
-            http2=setup.version == HTTPVersion.H2,
-            proxies=setup.proxy,
-            follow_redirects=True
-        ) as client:
-            response = client.request(
-                setup.method,
-                str(setup.url),
-                content=setup.content,
-                data=setup.data,
-                json=setup.json,
-                files=setup.files,
-                headers=tuple(setup.headers.items()),
-                timeout=setup.timeout
-            )
-            try:
-                content = response.text
-                if content is None or content.strip() == "" :
-                    content = response.content
-            except Exception:
-                content = response.content
-            
-            return Response(
-                response.status_code,
-                headers=response.headers.multi_items(),
-                content=content,
-                request=setup
-            )
+        client = self._get_client(setup)
+        # 共享客户端不保存 Cookie，改由请求自身的 Cookie 容器收发
+        cookies = httpx.Cookies(setup.cookies.jar)
+        request = client.build_request(
+            setup.method,
+            str(setup.url),
+            content=setup.content,
+            data=setup.data,
+            json=setup.json,
+            files=setup.files,
+            headers=setup.headers,
+            cookies=cookies,
+            timeout=setup.timeout
+        )
+        response = client.send(request)
+        cookies.extract_cookies(response)
+        # 手动跟随重定向，httpx 在重定向时只会使用客户端自身的 Cookie
+        redirects = 0
+        while (request := response.next_request) is not None:
+            if redirects >= client.max_redirects:
+                raise httpx.TooManyRedirects('Exceeded maximum allowed redirects.', request=request)
+            redirects += 1
+            cookies.set_cookie_header(request)
+            response = client.send(request)
+            cookies.extract_cookies(response)
+        # 仅对文本类响应解码，二进制响应直接返回原始字节
+        content: Union[str, bytes] = response.content
+        if _is_text_content_type(response.headers.get('content-type', '')):
+            with suppress(UnicodeDecodeError, LookupError):
+                text = response.text
+                if text.strip():
+                    content = text
+        
+        return Response(
+            response.status_code,
+            headers=response.headers.multi_items(),
+            content=content,
+            request=setup
+        )
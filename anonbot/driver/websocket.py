@@ -1,11 +1,13 @@
 '''websocket 驱动适配'''
 
 import logging
+from threading import Lock
 from functools import wraps
 from contextlib import contextmanager
 from typing_extensions import override
-from typing import Union, TypeVar, Callable, Generator, ParamSpec
+from typing import Any, Union, TypeVar, Callable, Optional, Generator, ParamSpec
 
+from anonbot.driver import Driver
 from anonbot.driver import Request
 from anonbot.log import LoggingHandler
 from anonbot.exception import WebSocketClosed
@@ -36,6 +38,11 @@ def catch_closed(func: Callable[P, T]) -> Callable[P, T]:
 class Mixin(WebSocketClientMixin):
     '''websocket 混入驱动适配'''
     
+    _connections: dict[tuple[str, tuple[tuple[str, str], ...]], WebSocketClient]
+    '''以 `keep_alive` 保留的空闲连接，按 `(URL, 请求头)` 索引'''
+    _connections_lock = Lock()
+    '''连接缓存锁'''
+    
     @property
     @override
     def type(self) -> str:
@@ -43,16 +50,61 @@ class Mixin(WebSocketClientMixin):
     
     @override
     @contextmanager
-    def websocket(self, setup: Request) -> Generator["WebSocket", None, None]:
-        ws = create_connection(
-            str(setup.url),
-            timeout=setup.timeout,
-            header={**setup.headers, **setup.cookies.as_header(setup)}
-        )
+    def websocket(self, setup: Request, *, keep_alive: bool = False) -> Generator["WebSocket", None, None]:
+        header = dict(setup.headers)
+        if cookie_header := setup.cookies.as_header(setup):
+            header.update(cookie_header)
+        key = (str(setup.url), tuple(sorted(header.items())))
+        ws = self._checkout_connection(key) if keep_alive else None
+        if ws is None:
+            ws = create_connection(
+                str(setup.url),
+                timeout=setup.timeout,
+                header=header,
+                enable_multithread=True
+            )
         
         try:
             yield WebSocket(request=setup, websocket=ws)
-        finally:
+        except BaseException:
+            # 出错后连接状态不可信，不再复用
+            ws.close()
+            raise
+        if not (keep_alive and self._checkin_connection(key, ws)):
+            ws.close()
+    
+    def _checkout_connection(self, key: tuple[str, tuple[tuple[str, str], ...]]) -> Optional[WebSocketClient]:
+        '''取出一个可用的空闲连接'''
+        # 组合驱动器不会调用混入类的 `__init__`，故在此惰性初始化
+        with self._connections_lock:
+            connections: Optional[dict[Any, WebSocketClient]] = self.__dict__.get('_connections')
+            if connections is None:
+                connections = self.__dict__.setdefault('_connections', {})
+                if isinstance(self, Driver):
+                    self.on_shutdown(self._close_connections)
+            ws = connections.pop(key, None)
+        if ws is not None and not ws.connected:
+            ws.close()
+            return None
+        return ws
+    
+    def _checkin_connection(self, key: tuple[str, tuple[tuple[str, str], ...]], ws: WebSocketClient) -> bool:
+        '''归还连接，返回连接是否被保留'''
+        if not ws.connected:
+            return False
+        with self._connections_lock:
+            connections: Optional[dict[Any, WebSocketClient]] = self.__dict__.get('_connections')
+            # 已退出或已有相同请求的空闲连接时不再保留
+            if connections is None or key in connections:
+                return False
+            connections[key] = ws
+            return True
+    
+    def _close_connections(self) -> None:
+        '''关闭所有空闲连接'''
+        with self._connections_lock:
+            connections: dict[Any, WebSocketClient] = self.__dict__.pop('_connections', {})
+        for ws in connections.values():
             ws.close()
 
 class WebSocket(BaseWebSocket):
@@ -62,6 +114,9 @@ class WebSocket(BaseWebSocket):
     def __init__(self, *, request: Request, websocket: WebSocketClient) -> None:
         super().__init__(request=request)
         self.websocket = websocket
+        # 预先绑定发送方法，省去每帧的属性查找
+        self._send_text = websocket.send
+        self._send_binary = websocket.send_binary
     
     @property
     @override
@@ -76,58 +131,38 @@ class WebSocket(BaseWebSocket):
     def close(self, code: int = 1000, reason: str = '') -> None:
         self.websocket.close(status=code, reason=reason.encode('utf-8'))
     
-    @override
     @catch_closed
-    def receive(self) -> Union[str, bytes]:
+    def _recv_frame(self) -> Union[str, bytes]:
+        '''接收一帧数据，收到关闭帧时抛出 `WebSocketClosed`'''
         opcode, data = self.websocket.recv_data()
-        if opcode == ABNF.OPCODE_CLOSE and isinstance(data, (str, bytes)):
-            if isinstance(data, bytes):
-                reason = data.decode('utf-8')
-            else:
-                assert isinstance(data, str), "data must be a str or bytes"
-                reason = data
-            raise WebSocketClosed(1000, reason)
-        
+        if opcode == ABNF.OPCODE_CLOSE:
+            raise WebSocketClosed(
+                1000, data.decode('utf-8') if isinstance(data, bytes) else data
+            )
         return data
     
     @override
-    @catch_closed
+    def receive(self) -> Union[str, bytes]:
+        return self._recv_frame()
+    
+    @override
     def receive_text(self) -> str:
-        opcode, data = self.websocket.recv_data()
-        if opcode == ABNF.OPCODE_CLOSE and isinstance(data, (str, bytes)):
-            if isinstance(data, bytes):
-                reason = data.decode('utf-8')
-            else:
-                assert isinstance(data, str), "data must be a str or bytes"
-                reason = data
-            raise WebSocketClosed(1000, reason)
-        
+        data = self._recv_frame()
         if not isinstance(data, str):
             raise TypeError('WebSocket 接收到的为非文本数据')
-        
         return data
     
     @override
-    @catch_closed
     def receive_bytes(self) -> bytes:
-        opcode, data = self.websocket.recv_data()
-        if opcode == ABNF.OPCODE_CLOSE and isinstance(data, (str, bytes)):
-            if isinstance(data, bytes):
-                reason = data.decode('utf-8')
-            else:
-                assert isinstance(data, str), "data must be a str or bytes"
-                reason = data
-            raise WebSocketClosed(1000, reason)
-        
+        data = self._recv_frame()
         if not isinstance(data, bytes):
             raise TypeError('WebSocket 接收到的为非字节数据')
-        
         return data
     
     @override
     def send_text(self, data: str) -> None:
-        self.websocket.send(data)
+        self._send_text(data)
     
     @override
     def send_bytes(self, data: bytes) -> None:
-        self.websocket.send(data)
+        self._send_binary(data)
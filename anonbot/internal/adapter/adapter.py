@@ -1,6 +1,7 @@
 import abc
+import sys
 from contextlib import contextmanager
-from typing import Any, Generator
+from typing import Any, Optional, Generator
 
 from anonbot.config import Config, BaseConfig
 from anonbot.internal.driver import (
@@ -19,15 +20,28 @@ from .bot import Bot
 class Adapter(abc.ABC):
     '''协议适配器基类'''
     
+    _config_key: Optional[str] = None
+    '''协议适配器在配置中的键名，定义子类时根据 `get_name` 生成'''
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        try:
+            cls._config_key = sys.intern(cls.get_name().lower())
+        except NotImplementedError:
+            # 未实现 `get_name` 的中间基类
+            cls._config_key = None
+    
     def __init__(self, driver: Driver, **kwargs: Any) -> None:
         self.driver: Driver = driver
         '''协议适配器所属的 `anonbot.internal.driver.Driver` 实例'''
         self.bots: dict[str, Bot] = {}
         '''本协议适配器已建立连接的 `anonbot.adapters.Bot` 实例'''
-        try:
-            self._config: dict[str, Any] = self.config.get(self.get_name().lower(), {})
-        except AttributeError:
-            self._config = {}
+        self._config: dict[str, Any] = {}
+        if self._config_key is not None:
+            try:
+                self._config = self.config.get(self._config_key, {})
+            except AttributeError:
+                self._config = {}
     
     def __repr__(self) -> str:
         return f'Adapter(name={self.get_name()!r})'
@@ -77,11 +91,16 @@ class Adapter(abc.ABC):
         return self.driver.request(setup)
     
     @contextmanager
-    def websocket(self, setup: Request) -> Generator[WebSocket, None, None]:
-        '''建立一个 WebSocket 客户端连接请求'''
+    def websocket(self, setup: Request, *, keep_alive: bool = False) -> Generator[WebSocket, None, None]:
+        '''建立一个 WebSocket 客户端连接请求
+
+        参数:
+            setup (Request): 连接请求
+            keep_alive (bool): 退出上下文后是否保留连接，供相同的请求再次使用
+        '''
         if not isinstance(self.driver, WebSocketClientMixin):
             raise TypeError('Current driver does not support websocket client')
-        with self.driver.websocket(setup) as websocket:
+        with self.driver.websocket(setup, keep_alive=keep_alive) as websocket:
             yield websocket
     
     @abc.abstractmethod
@@ -46,7 +46,16 @@ class Bot(abc.ABC):
     def __getattr__(self, name: str) -> '_ApiCall':
         if name.startswith('__') and name.endswith('__'):
             raise AttributeError(f'{self.__class__.__name__} object has no attribute {name}')
-        return partial(self.call_api, name)
+        # 仅缓存实际调用过的 API，`hasattr` 等探测不会留下条目
+        api_cache: Optional[dict[str, '_ApiCall']] = self.__dict__.get('_api_cache')
+        if api_cache is not None and (api := api_cache.get(name)) is not None:
+            return api
+        
+        def _call(**data: Any) -> Any:
+            self.__dict__.setdefault('_api_cache', {})[name] = partial(self.call_api, name)
+            return self.call_api(name, **data)
+        
+        return _call
     
     @property
     def type(self) -> str:
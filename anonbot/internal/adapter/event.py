@@ -2,9 +2,9 @@ import abc
 from datetime import datetime
 from typing import Any, Type, Union, TypeVar, Optional
 
-from pydantic import BaseModel, ConfigDict, TypeAdapter
+from pydantic import BaseModel, ConfigDict
 
-from .message import Message
+from .message import Message, _get_type_adapter
 from .models import Message as SatoriMessage
 from .uni.message import Message as UniMessage
 from .models import (
@@ -120,7 +120,7 @@ class Event(abc.ABC, BaseModel):
     def validate(cls: Type['E'], value: Any) -> 'E':
         if isinstance(value, Event) and not isinstance(value, cls):
             raise TypeError(f'{value} is incompatible with Event type {cls}')
-        return TypeAdapter(cls).validate_python(value)
+        return _get_type_adapter(cls).validate_python(value)
     
     @abc.abstractmethod
     def get_type(self) -> Union[EventType, str]:
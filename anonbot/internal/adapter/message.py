@@ -1,6 +1,7 @@
 import abc
 from copy import deepcopy
-from dataclasses import field, asdict, dataclass
+from functools import lru_cache
+from dataclasses import field, fields, dataclass
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -31,7 +32,33 @@ if TYPE_CHECKING:
 TMS = TypeVar('TMS', bound='MessageSegment')
 TM = TypeVar('TM', bound='Message')
 
-@dataclass
+_IMMUTABLE_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+'''复制消息时可直接共享的不可变类型'''
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    '''获取消息段类型的字段名'''
+    return tuple(f.name for f in fields(cls))
+
+@lru_cache(maxsize=None)
+def _get_type_adapter(type_: type) -> TypeAdapter[Any]:
+    '''获取类型对应的 `TypeAdapter`，每个类型只构建一次'''
+    return TypeAdapter(type_)
+
+def _clone_value(value: Any) -> Any:
+    '''复制消息段中的值，容器逐层复制，不可变值直接共享'''
+    value_type = type(value)
+    if value_type in _IMMUTABLE_TYPES:
+        return value
+    if value_type is dict:
+        return {key: _clone_value(item) for key, item in value.items()}
+    if value_type is list:
+        return [_clone_value(item) for item in value]
+    if isinstance(value, (MessageSegment, Message)):
+        return value.copy()
+    return deepcopy(value)
+
+@dataclass(slots=True)
 class MessageSegment(abc.ABC, Generic[TM]):
     '''消息段基类'''
     type: str
@@ -79,20 +106,36 @@ class MessageSegment(abc.ABC, Generic[TM]):
     def get(self, key: str, default: Any=None) -> Any:
         return self.data.get(key, default)
     
+    def _as_dict(self) -> dict[str, Any]:
+        '''以字段名为键的浅层字典，值直接引用消息段自身的数据'''
+        return {name: getattr(self, name, None) for name in _field_names(self.__class__)}
+    
     def keys(self) -> KeysView[Any]:
-        return asdict(self).keys()
+        return self._as_dict().keys()
     
     def values(self) -> ValuesView[Any]:
-        return asdict(self).values()
+        return self._as_dict().values()
     
     def items(self) -> ItemsView[str, Any]:
-        return asdict(self).items()
+        return self._as_dict().items()
     
     def join(self: TMS, iterable: Iterable[Union[TMS, TM]]) -> TM:
         return self.get_message_class()(self).join(iterable)
     
     def copy(self) -> Self:
-        return deepcopy(self)
+        '''深拷贝消息段'''
+        # 绕过构造函数逐字段复制，子类自定义的 `__init__` 不会被调用
+        segment = object.__new__(self.__class__)
+        for name in _field_names(self.__class__):
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                continue
+            object.__setattr__(segment, name, _clone_value(value))
+        return segment
+    
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return self.copy()
     
     @abc.abstractmethod
     def is_text(self) -> bool:
@@ -111,6 +154,9 @@ class Message(list[TMS], abc.ABC):
             return
         elif isinstance(message, str):
             self.extend(self._construct(message))
+        elif isinstance(message, (list, tuple)):
+            # 消息与常见序列无需经过 ABC 的类型检查
+            self.extend(message)
         elif isinstance(message, MessageSegment):
             self.append(message)
         elif isinstance(message, Iterable):
@@ -118,6 +164,19 @@ class Message(list[TMS], abc.ABC):
         else:
             self.extend(self._construct(message))
     
+    _type_index: Optional[dict[str, list[int]]] = None
+    '''各类型消息段所在位置，首次按类型查询时建立，消息变更时失效'''
+    
+    def _get_type_index(self) -> dict[str, list[int]]:
+        '''获取消息段类型索引，不存在时一次遍历建立'''
+        type_index = self._type_index
+        if type_index is None:
+            type_index = {}
+            for position, segment in enumerate(self):
+                type_index.setdefault(segment.type, []).append(position)
+            self._type_index = type_index
+        return type_index
+    
     @classmethod
     @abc.abstractmethod
     def get_segment_class(cls) -> Type[TMS]:
@@ -140,9 +199,10 @@ class Message(list[TMS], abc.ABC):
         elif isinstance(value, str):
             pass
         elif isinstance(value, dict):
-            value = TypeAdapter(cls.get_segment_class()).validate_python(value)
+            value = _get_type_adapter(cls.get_segment_class()).validate_python(value)
         elif isinstance(value, Iterable):
-            value = [TypeAdapter(cls.get_segment_class()).validate_python(v) for v in value]
+            validate = _get_type_adapter(cls.get_segment_class()).validate_python
+            value = [validate(v) for v in value]
         else:
             raise ValueError(f'Message need str, dict or Iterable for value, not {type(value)}')
         return cls(value)
@@ -165,6 +225,8 @@ class Message(list[TMS], abc.ABC):
     def __iadd__(self, other: str | TMS | Iterable[TMS]) -> Self:
         if isinstance(other, str):
             self.extend(self._construct(other))
+        elif isinstance(other, (list, tuple)):
+            self.extend(other)
         elif isinstance(other, MessageSegment):
             self.append(other)
         elif isinstance(other, Iterable):
@@ -248,12 +310,19 @@ class Message(list[TMS], abc.ABC):
             return super().__getitem__(arg1)
         elif isinstance(arg1, slice) and arg2 is None:
             return self.__class__(super().__getitem__(arg1))
-        elif isinstance(arg1, str) and arg2 is None:
-            return self.__class__(filter(lambda x: x.type == arg1, self))
-        elif isinstance(arg1, str) and isinstance(arg2, int):
-            return [seg for seg in self if seg.type == arg1][arg2]
-        elif isinstance(arg1, str) and isinstance(arg2, slice):
-            return self.__class__([seg for seg in self if seg.type == arg1][arg2])
+        elif isinstance(arg1, str):
+            # 按类型的查询均经由类型索引，无需遍历消息
+            positions = self._get_type_index().get(arg1, [])
+            getitem = super().__getitem__
+            if arg2 is None or isinstance(arg2, slice):
+                message = self.__class__()
+                super(Message, message).extend(
+                    [getitem(i) for i in (positions if arg2 is None else positions[arg2])]
+                )
+                return message
+            if isinstance(arg2, int):
+                return getitem(positions[arg2])
+            raise ValueError('Incorrect arguments to slice')
         else:
             raise ValueError('Incorrect arguments to slice')
     
@@ -267,7 +336,7 @@ class Message(list[TMS], abc.ABC):
             bool: 消息内是否存在给定消息段或给定类型的消息段
         '''
         if isinstance(value, str):
-            return bool(next(filter(lambda x: x.type == value, self), None))
+            return value in self._get_type_index()
         return super().__contains__(value)
     
     def has(self, value: Union[TMS, str]) -> bool:
@@ -292,10 +361,12 @@ class Message(list[TMS], abc.ABC):
             int: 索引 index
         '''
         if isinstance(value, str):
-            first_segment = next(filter(lambda x: x.type == value, self), None)
-            if first_segment is None:
+            positions = self._get_type_index().get(value)
+            if not positions:
                 raise ValueError(f'Type {value} not found in message')
-            return super().index(first_segment, *args)
+            if not args:
+                return positions[0]
+            return super().index(super().__getitem__(positions[0]), *args)
         return super().index(value, *args)
     
     def get(self, type_: str, count: Optional[int] = None) -> Self:
@@ -310,14 +381,7 @@ class Message(list[TMS], abc.ABC):
         '''
         if count is None:
             return self[type_]
-        
-        iterator, filtered = filter(lambda x: x.type == type_, self), self.__class__()
-        for _ in range(count):
-            seg = next(iterator, None)
-            if seg is None:
-                break
-            filtered.append(seg)
-        return filtered
+        return self[type_, :max(count, 0)]
     
     def count(self, value: Union[TMS, str]) -> int:
         '''计算指定消息段的个数
@@ -328,7 +392,9 @@ class Message(list[TMS], abc.ABC):
         返回:
             int: 个数
         '''
-        return len(self[value]) if isinstance(value, str) else super().count(value)
+        if isinstance(value, str):
+            return len(self._get_type_index().get(value, ()))
+        return super().count(value)
     
     def only(self, value: Union[TMS, str]) -> bool:
         '''检查消息是否仅包含指定消息段
@@ -349,6 +415,7 @@ class Message(list[TMS], abc.ABC):
         参数:
             obj (str | TMS): 要添加的消息段
         '''
+        self._type_index = None
         if isinstance(obj, MessageSegment):
             super().append(obj)
         elif isinstance(obj, str):
@@ -363,10 +430,54 @@ class Message(list[TMS], abc.ABC):
         参数:
             obj (Self | Iterable[TMS]): 要添加的消息数组
         '''
+        self._type_index = None
+        if type(obj) is type(self) or isinstance(obj, Message):
+            # 消息数组中只有消息段，整体拼接即可
+            super().extend(obj)
+            return self
         for segment in obj:
-            self.append(segment)
+            if isinstance(segment, MessageSegment):
+                super().append(segment)
+            else:
+                self.append(segment)
         return self
     
+    def insert(self, index: SupportsIndex, obj: TMS) -> None:
+        self._type_index = None
+        super().insert(index, obj)
+    
+    def pop(self, index: SupportsIndex = -1) -> TMS:
+        self._type_index = None
+        return super().pop(index)
+    
+    def remove(self, value: TMS) -> None:
+        self._type_index = None
+        super().remove(value)
+    
+    def clear(self) -> None:
+        self._type_index = None
+        super().clear()
+    
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        self._type_index = None
+        super().sort(*args, **kwargs)
+    
+    def reverse(self) -> None:
+        self._type_index = None
+        super().reverse()
+    
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self._type_index = None
+        super().__setitem__(index, value)
+    
+    def __delitem__(self, index: Union[SupportsIndex, slice]) -> None:
+        self._type_index = None
+        super().__delitem__(index)
+    
+    def __imul__(self, value: SupportsIndex) -> Self:
+        self._type_index = None
+        return super().__imul__(value)
+    
     def join(self, iterable: Iterable[Union[TMS, Self]]) -> Self:
         '''将多个消息连接并将自身作为分割
 
@@ -376,19 +487,28 @@ class Message(list[TMS], abc.ABC):
         返回:
             Self: 连接后的消息
         '''
-        ret = self.__class__()
+        # 先收集复制后的消息段，最后一次性写入结果
+        segments: list[TMS] = []
         for index, message in enumerate(iterable):
             if index != 0:
-                ret.extend(self)
+                segments.extend(seg.copy() for seg in self)
             if isinstance(message, MessageSegment):
-                ret.append(message.copy())
+                segments.append(message.copy())
             else:
-                ret.extend(message.copy())
+                segments.extend(seg.copy() for seg in message)
+        ret = self.__class__()
+        super(Message, ret).extend(segments)
         return ret
     
     def copy(self) -> Self:
         '''深拷贝消息'''
-        return deepcopy(self)
+        message = self.__class__()
+        # 逐段复制后直接写入，不再经过 `append` 的类型分派
+        list.extend(message, [segment.copy() for segment in self])
+        return message
+    
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return self.copy()
     
     def include(self, *types: str) -> Self:
         '''过滤消息
@@ -414,7 +534,7 @@ class Message(list[TMS], abc.ABC):
     
     def extract_plain_text(self) -> str:
         '''提取消息内纯文本消息'''
-        return ''.join(map(str, filter(lambda x: x.is_text(), self)))
+        return ''.join([str(seg) for seg in self if seg.is_text()])
 
     @staticmethod
     @abc.abstractmethod
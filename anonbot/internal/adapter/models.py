@@ -6,6 +6,17 @@ from pydantic import BaseModel, field_validator
 
 T = TypeVar('T')
 
+_fromtimestamp = datetime.fromtimestamp
+
+def _parse_timestamp(value: Optional[Union[int, float, datetime]]) -> Optional[datetime]:
+    '''解析时间戳，整数视为毫秒，浮点数视为秒'''
+    value_type = type(value)
+    if value_type is int:
+        return _fromtimestamp(value / 1000.0) # type: ignore
+    if value_type is float:
+        return _fromtimestamp(value) # type: ignore
+    return value # type: ignore
+
 class Channel(BaseModel):
     '''频道'''
     
@@ -56,14 +67,7 @@ class GuildMember(BaseModel):
     @classmethod
     def joined_at_validator(cls, value: Optional[Union[int, float, datetime]]) -> Optional[datetime]:
         '''加入时间验证器'''
-        
-        if value is not None:
-            if isinstance(value, int):
-                return datetime.fromtimestamp(value / 1000.0)
-            elif isinstance(value, float):
-                return datetime.fromtimestamp(value)
-            return value
-        return None
+        return _parse_timestamp(value)
 
 class GuildRole(BaseModel):
     '''群组角色'''
@@ -135,31 +139,11 @@ class Message(BaseModel):
     updated_at: Optional[datetime] = None
     '''消息修改的时间戳'''
     
-    @field_validator('created_at', mode='before')
+    @field_validator('created_at', 'updated_at', mode='before')
     @classmethod
-    def created_at_validator(cls, value: Optional[Union[int, float, datetime]]) -> Optional[datetime]:
-        '''创建时间验证器'''
-        
-        if value is not None:
-            if isinstance(value, int):
-                return datetime.fromtimestamp(value / 1000.0)
-            elif isinstance(value, float):
-                return datetime.fromtimestamp(value)
-            return value
-        return None
-    
-    @field_validator('updated_at', mode='before')
-    @classmethod
-    def updated_at_validator(cls, value: Optional[Union[int, float, datetime]]) -> Optional[datetime]:
-        '''更新时间验证器'''
-        
-        if value is not None:
-            if isinstance(value, int):
-                return datetime.fromtimestamp(value / 1000.0)
-            elif isinstance(value, float):
-                return datetime.fromtimestamp(value)
-            return value
-        return None
+    def timestamp_validator(cls, value: Optional[Union[int, float, datetime]]) -> Optional[datetime]:
+        '''创建与更新时间验证器'''
+        return _parse_timestamp(value)
 
 class User(BaseModel):
     '''用户'''
@@ -240,3 +224,9 @@ class EventType(StrEnum):
     
     INTERNAL = 'internal'
     '''内部事件'''
+
+# 所有模型定义完成后统一解析前向引用，避免首次校验时才重建
+Channel.model_rebuild()
+GuildMember.model_rebuild()
+Login.model_rebuild()
+Message.model_rebuild()
@@ -3,7 +3,6 @@
 '''
 from io import BytesIO
 from pathlib import Path
-from copy import deepcopy
 from typing_extensions import override
 from types import MethodType, FunctionType
 from typing import TYPE_CHECKING, Any, Type, Union, Callable, Iterable, Optional
@@ -62,11 +61,6 @@ class Message(BaseMessage[MessageSegment]):
             return self.other(name, **kwargs)
         return _type
     
-    def __deepcopy__(self, memo) -> 'Message':
-        _new_message = Message()
-        _new_message.extend([deepcopy(seg) for seg in self])
-        return _new_message
-    
     @staticmethod
     @override
     def _construct(message: str) -> Iterable[MessageSegment]:
@@ -74,7 +68,19 @@ class Message(BaseMessage[MessageSegment]):
     
     @override
     def extract_plain_text(self) -> str:
-        return ''.join(seg.data['text'] for seg in self if seg.is_text())
+        # 先按已知的文本消息段类型判断，其余消息段再回退到 `is_text`
+        texts: list[str] = []
+        for seg in self:
+            if isinstance(seg, (Text, Style)):
+                texts.append(seg.data['text'])
+            elif isinstance(seg, Br):
+                texts.append('\n')
+            elif isinstance(seg, Link):
+                if seg.children:
+                    texts.append(seg.children.extract_plain_text())
+            elif seg.is_text() and 'text' in seg.data:
+                texts.append(seg.data['text'])
+        return ''.join(texts)
 
     @staticmethod
     @override
@@ -19,6 +19,7 @@ class SrcBase64(TypedDict):
     type: str
     '''MIME 类型'''
 
+@dataclass(slots=True)
 class MessageSegment(BaseMessageSegment['Message']):
     children: Optional['Message'] = None
     '''子消息链'''
@@ -37,18 +38,17 @@ class MessageSegment(BaseMessageSegment['Message']):
         )
     
     def __getattr__(self, name: str) -> Any:
+        if name == 'children':
+            # 子类的构造函数不会初始化 `children` 槽位
+            return None
         if name in self.data:
             return self.data[name]
         return None
     
-    def __deepcopy__(self, memo: Any) -> 'MessageSegment':
-        if type(self) is Other:
-            return Other(self.type, **self.data.copy())
-        return type(self)(**self.data.copy())
-    
     @classmethod
     @override
     def get_message_class(cls) -> Type['Message']:
+        from .message import Message # 延迟导入以避免循环引用
         return Message
     
     def set_children(self, children: Optional['Message'] = None) -> Self:
@@ -66,7 +66,7 @@ class MessageSegment(BaseMessageSegment['Message']):
 class TextData(TypedDict):
     text: str
 
-@dataclass
+@dataclass(slots=True)
 class Text(MessageSegment):
     data: TextData = field(default_factory=dict) # type: ignore
     
@@ -88,7 +88,7 @@ class AtData(TypedDict):
     role: NotRequired[str]
     type: NotRequired[str]
 
-@dataclass
+@dataclass(slots=True)
 class At(MessageSegment):
     data: AtData = field(default_factory=dict) # type: ignore
     
@@ -114,7 +114,7 @@ class SharpData(TypedDict):
     id: str
     name: NotRequired[str]
 
-@dataclass
+@dataclass(slots=True)
 class Sharp(MessageSegment):
     data: SharpData = field(default_factory=dict) # type: ignore
     
@@ -127,7 +127,7 @@ class Sharp(MessageSegment):
 class LinkData(TypedDict):
     href: str
 
-@dataclass
+@dataclass(slots=True)
 class Link(MessageSegment):
     data: LinkData = field(default_factory=dict) # type: ignore
     
@@ -149,7 +149,7 @@ class ImageData(SrcData, total=False):
     width: NotRequired[int]
     height: NotRequired[int]
 
-@dataclass
+@dataclass(slots=True)
 class Image(MessageSegment):
     data: ImageData = field(default_factory=dict) # type: ignore
     
@@ -179,7 +179,7 @@ class AudioData(SrcData, total=False):
     duration: NotRequired[float]
     poster: NotRequired[str]
 
-@dataclass
+@dataclass(slots=True)
 class Audio(MessageSegment):
     data: AudioData = field(default_factory=dict) # type: ignore
     
@@ -211,7 +211,7 @@ class VideoData(SrcData, total=False):
     duration: NotRequired[float]
     poster: NotRequired[str]
 
-@dataclass
+@dataclass(slots=True)
 class Video(MessageSegment):
     data: VideoData = field(default_factory=dict) # type: ignore
     
@@ -246,7 +246,7 @@ class Video(MessageSegment):
 class FileData(SrcData, total=False):
     poster: NotRequired[str]
 
-@dataclass
+@dataclass(slots=True)
 class File(MessageSegment):
     data: FileData = field(default_factory=dict) # type: ignore
     
@@ -273,7 +273,7 @@ class StyleData(TypedDict):
     text: str
     style: str
 
-@dataclass
+@dataclass(slots=True)
 class Style(MessageSegment):
     data: StyleData = field(default_factory=dict) # type: ignore
     
@@ -285,9 +285,11 @@ class Style(MessageSegment):
     def is_text(self) -> bool:
         return True
 
+@dataclass(slots=True)
 class Br(MessageSegment):
     def __init__(self) -> None:
         self.type = 'br'
+        self.data = {}
 
     @override
     def is_text(self) -> bool:
@@ -297,7 +299,7 @@ class RenderMessageData(TypedDict):
     id: NotRequired[str]
     forward: NotRequired[bool]
 
-@dataclass
+@dataclass(slots=True)
 class RenderMessage(MessageSegment):
     data: RenderMessageData = field(default_factory=dict) # type: ignore
     
@@ -320,7 +322,7 @@ class QuoteData(TypedDict):
     id: NotRequired[str]
     forward: NotRequired[bool]
 
-@dataclass
+@dataclass(slots=True)
 class Quote(MessageSegment):
     data: QuoteData = field(default_factory=dict) # type: ignore
     
@@ -344,7 +346,7 @@ class AuthorData(TypedDict):
     name: NotRequired[str]
     avatar: NotRequired[str]
 
-@dataclass
+@dataclass(slots=True)
 class Author(MessageSegment):
     data: AuthorData = field(default_factory=dict) # type: ignore
     
@@ -365,7 +367,7 @@ class ButtonData(TypedDict):
     text: NotRequired[str]
     theme: NotRequired[str]
 
-@dataclass
+@dataclass(slots=True)
 class Button(MessageSegment):
     data: ButtonData = field(default_factory=dict) # type: ignore
     
@@ -390,7 +392,7 @@ class Button(MessageSegment):
         if theme is not None:
             self.data['theme'] = theme
 
-@dataclass
+@dataclass(slots=True)
 class Other(MessageSegment):
     def __init__(self, type: str, **kwargs: Any) -> None:
         self.type = type
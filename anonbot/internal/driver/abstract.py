@@ -67,13 +67,23 @@ class Driver(abc.ABC):
         logger.debug(f'Adapters Loaded: {", ".join(self._adapters)}')
     
     @abc.abstractmethod
-    def on_startup(self, func: Callable) -> Callable:
-        """注册一个在驱动器启动时执行的函数"""
+    def on_startup(self, func: Callable, *, concurrent: bool = False) -> Callable:
+        """注册一个在驱动器启动时执行的函数
+
+        参数:
+            func (Callable): 要执行的函数
+            concurrent (bool): 是否与其余可并发函数一同在线程池中并发执行，默认在当前线程按注册顺序依次执行
+        """
         raise NotImplementedError
 
     @abc.abstractmethod
-    def on_shutdown(self, func: Callable) -> Callable:
-        """注册一个在驱动器停止时执行的函数"""
+    def on_shutdown(self, func: Callable, *, concurrent: bool = False) -> Callable:
+        """注册一个在驱动器停止时执行的函数
+
+        参数:
+            func (Callable): 要执行的函数
+            concurrent (bool): 是否与其余可并发函数一同在线程池中并发执行，默认在当前线程按注册顺序依次执行
+        """
         raise NotImplementedError
     
     def _bot_connect(self, bot: 'Bot', platform: str) -> None:
@@ -127,8 +137,13 @@ class WebSocketClientMixin(ClientMixin):
     
     @abc.abstractmethod
     @contextmanager
-    def websocket(self, setup: Request) -> Generator[WebSocket, None, None]:
-        '''发起一个 WebSocket 连接'''
+    def websocket(self, setup: Request, *, keep_alive: bool = False) -> Generator[WebSocket, None, None]:
+        '''发起一个 WebSocket 连接
+
+        参数:
+            setup (Request): 连接请求
+            keep_alive (bool): 退出上下文后是否保留连接，供相同的请求再次使用
+        '''
         raise NotImplementedError
         yield
 
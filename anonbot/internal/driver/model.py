@@ -273,6 +273,9 @@ class Cookies(MutableMapping):
             self.jar.set_cookie(cookie)
     
     def as_header(self, request: Request) -> dict[str, str]:
+        # 没有 Cookie 时无需构造兼容请求
+        if not len(self.jar):
+            return {}
         urllib_request = self._CookieCompatRequest(request)
         self.jar.add_cookie_header(urllib_request)
         return urllib_request.added_headers
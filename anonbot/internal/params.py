@@ -208,6 +208,13 @@ class BotParam(Param):
             + ')'
         )
     
+    @classmethod
+    @override
+    def _claimed_annotations(cls) -> Tuple[Any, ...]:
+        from anonbot.adapter import Bot
+        
+        return (Bot,)
+    
     @classmethod
     @override
     def _check_param(
@@ -254,6 +261,13 @@ class EventParam(Param):
             + ')'
         )
     
+    @classmethod
+    @override
+    def _claimed_annotations(cls) -> Tuple[Any, ...]:
+        from anonbot.adapter import Event
+        
+        return (Event,)
+    
     @classmethod
     @override
     def _check_param(cls, param: inspect.Parameter, allow_types: Tuple[Type[Param], ...]) -> Optional[Self]:
@@ -286,6 +300,11 @@ class StateParam(Param):
     def __repr__(self) -> str:
         return 'StateParam()'
     
+    @classmethod
+    @override
+    def _claimed_annotations(cls) -> Tuple[Any, ...]:
+        return (StateType,)
+    
     @classmethod
     @override
     def _check_param(cls, param: inspect.Parameter, allow_types: Tuple[Type[Param], ...]) -> Optional[Self]:
@@ -312,6 +331,13 @@ class ProcessorParam(Param):
             + ')'
         )
     
+    @classmethod
+    @override
+    def _claimed_annotations(cls) -> Tuple[Any, ...]:
+        from anonbot.processor import Processor
+        
+        return (Processor,)
+    
     @classmethod
     @override
     def _check_param(cls, param: inspect.Parameter, allow_types: Tuple[Type[Param], ...]) -> Optional[Self]:
@@ -14,105 +14,126 @@ class _Guild:
     
     __slots__ = ()
     
+    _types = frozenset((
+        _EventType.GUILD_ADDED,
+        _EventType.GUILD_UPDATED,
+        _EventType.GUILD_REMOVED,
+        _EventType.GUILD_REQUEST
+    ))
+    '''匹配的事件类型'''
+    
     def __repr__(self) -> str:
         return 'Guild()'
     
     def __call__(self, type: str = EventType()) -> bool:
-        return type in (
-            _EventType.GUILD_ADDED,
-            _EventType.GUILD_UPDATED,
-            _EventType.GUILD_REMOVED,
-            _EventType.GUILD_REQUEST
-        )
+        return type in self._types
 
 class _GuildMember:
     '''检查是否为 `GuildMember` 事件'''
     
     __slots__ = ()
     
+    _types = frozenset((
+        _EventType.GUILD_MEMBER_ADDED,
+        _EventType.GUILD_MEMBER_UPDATED,
+        _EventType.GUILD_MEMBER_REMOVED,
+        _EventType.GUILD_MEMBER_REQUEST
+    ))
+    '''匹配的事件类型'''
+    
     def __repr__(self) -> str:
         return 'GuildMember()'
     
     def __call__(self, type: str = EventType()) -> bool:
-        return type in (
-            _EventType.GUILD_MEMBER_ADDED,
-            _EventType.GUILD_MEMBER_UPDATED,
-            _EventType.GUILD_MEMBER_REMOVED,
-            _EventType.GUILD_MEMBER_REQUEST
-        )
+        return type in self._types
 
 class _GuildRole:
     '''检查是否为 `GuildRole` 事件'''
     
     __slots__ = ()
     
+    _types = frozenset((
+        _EventType.GUILD_ROLE_CREATED,
+        _EventType.GUILD_ROLE_UPDATED,
+        _EventType.GUILD_ROLE_DELETED
+    ))
+    '''匹配的事件类型'''
+    
     def __repr__(self) -> str:
         return 'GuildRole()'
     
     def __call__(self, type: str = EventType()) -> bool:
-        return type in (
-            _EventType.GUILD_ROLE_CREATED,
-            _EventType.GUILD_ROLE_UPDATED,
-            _EventType.GUILD_ROLE_DELETED
-        )
+        return type in self._types
 
 class _Interaction:
     '''检查是否为 `Interaction` 事件'''
     
     __slots__ = ()
     
+    _types = frozenset((
+        _EventType.INTERACTION_BUTTON,
+        _EventType.INTERACTION_COMMAND
+    ))
+    '''匹配的事件类型'''
+    
     def __repr__(self) -> str:
         return 'Interaction()'
     
     def __call__(self, type: str = EventType()) -> bool:
-        return type in (
-            _EventType.INTERACTION_BUTTON,
-            _EventType.INTERACTION_COMMAND
-        )
+        return type in self._types
 
 class _Login:
     '''检查是否为 `Login` 事件'''
     
     __slots__ = ()
     
+    _types = frozenset((
+        _EventType.LOGIN_ADDED,
+        _EventType.LOGIN_REMOVED,
+        _EventType.LOGIN_UPDATED
+    ))
+    '''匹配的事件类型'''
+    
     def __repr__(self) -> str:
         return 'Login()'
     
     def __call__(self, type: str = EventType()) -> bool:
-        return type in (
-            _EventType.LOGIN_ADDED,
-            _EventType.LOGIN_REMOVED,
-            _EventType.LOGIN_UPDATED
-        )
+        return type in self._types
 
 class _Message:
     '''检查是否为 `Message` 事件'''
     
     __slots__ = ()
     
+    _types = frozenset((
+        _EventType.MESSAGE_CREATED,
+        _EventType.MESSAGE_UPDATED,
+        _EventType.MESSAGE_DELETED
+    ))
+    '''匹配的事件类型'''
+    
     def __repr__(self) -> str:
         return 'Message()'
     
     def __call__(self, type: str = EventType()) -> bool:
-        return type in (
-            _EventType.MESSAGE_CREATED,
-            _EventType.MESSAGE_UPDATED,
-            _EventType.MESSAGE_DELETED
-        )
+        return type in self._types
 
 class _Reaction:
     '''检查是否为 `Reaction` 事件'''
     
     __slots__ = ()
     
+    _types = frozenset((
+        _EventType.REACTION_ADDED,
+        _EventType.REACTION_REMOVED
+    ))
+    '''匹配的事件类型'''
+    
     def __repr__(self) -> str:
         return 'Reaction()'
     
     def __call__(self, type: str = EventType()) -> bool:
-        return type in (
-            _EventType.REACTION_ADDED,
-            _EventType.REACTION_REMOVED
-        )
+        return type in self._types
 
 class _User:
     '''检查是否为 `User` 事件'''
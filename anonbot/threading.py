@@ -11,6 +11,7 @@ from threading import (
     Lock as Lock,
     Event as Event,
     Thread as Thread,
+    Condition as Condition,
     main_thread as main_thread,
     current_thread as current_thread
 )
@@ -36,7 +37,9 @@ def get_pool_executor() -> 'ThreadPoolExecutor':
 
 def all_tasks() -> list['Task']:
     '''获取所有线程池执行器中的未完成任务'''
-    return [task for task in get_pool_executor()._all_tasks if not task.done()]
+    executor = get_pool_executor()
+    with executor._all_tasks_changed:
+        return [task for task in executor._all_tasks if not task.done()]
 
 def _Thread(*, target: Callable[..., Any], **kwargs: Any) -> Thread:
     '''创建一个线程
@@ -239,7 +242,8 @@ class ThreadPoolExecutor:
     
     _worker_lock: Lock = Lock()
     _submit_block: bool = False
-    _all_tasks: list[Task[Any]] = []
+    _all_tasks: set[Task[Any]] = set()
+    _all_tasks_changed: Condition = Condition()
     
     def __init__(self, max_workers: Optional[int] = None) -> None:
         if max_workers is None:
@@ -272,26 +276,32 @@ class ThreadPoolExecutor:
             try:
                 task()
             except BaseException as exception:
-                task.future.set_exception(exception)
-            finally:
-                if task in self._all_tasks:
-                    self._all_tasks.remove(task)
+                # 已被取消的任务在此处会抛出 `CancelledError`，不能再设置异常
+                if not task.future.done():
+                    task.future.set_exception(exception)
     
     def _temp_worker(self, task: Task[Any]) -> None:
         try:
             task()
         except BaseException as exception:
-            task.future.set_exception(exception)
-        finally:
-            if task in self._all_tasks:
-                self._all_tasks.remove(task)
+            if not task.future.done():
+                task.future.set_exception(exception)
+    
+    def _discard_task(self, task: Task[Any]) -> None:
+        '''任务完成或被取消时将其移出任务集合'''
+        with self._all_tasks_changed:
+            self._all_tasks.discard(task)
+            if not self._all_tasks:
+                self._all_tasks_changed.notify_all()
 
     def submit(self, task: Task[R], temp: bool = False) -> Future[R]:
         '''提交一个任务到线程池执行器'''
         if self._submit_block:
             raise RuntimeError('线程池执行器已关闭')
         with self._worker_lock:
-            self._all_tasks.append(task)
+            with self._all_tasks_changed:
+                self._all_tasks.add(task)
+            task.future.add_done_callback(lambda _: self._discard_task(task))
             if temp:
                 _thread = _Thread(target=self._temp_worker, args=(task,), daemon=True)
                 _thread.start()
@@ -307,8 +317,39 @@ class ThreadPoolExecutor:
                 worker.join()
         self._main_thread.join(0) if self._main_thread is not None else None
     
-    def stop(self) -> None:
-        '''停止线程池执行器'''
+    def wait_all_tasks(self, timeout: Optional[float] = None) -> bool:
+        '''等待所有任务完成
+
+        参数:
+            timeout (Optional[float]): 等待超时时间，默认为无限
+
+        返回:
+            bool: 所有任务是否已完成
+        '''
+        with self._all_tasks_changed:
+            return self._all_tasks_changed.wait_for(lambda: not self._all_tasks, timeout)
+    
+    def cancel_all(self, force: bool = False) -> None:
+        '''取消所有未完成的任务
+
+        参数:
+            force (bool): 是否强制取消
+        '''
+        with self._all_tasks_changed:
+            tasks = list(self._all_tasks)
+        for task in tasks:
+            if not task.done():
+                task.cancel(force)
+    
+    def stop(self, cancel_pending: bool = False) -> None:
+        '''停止线程池执行器
+
+        参数:
+            cancel_pending (bool): 是否强制取消仍未完成的任务
+        '''
+        self._submit_block = True
+        if cancel_pending:
+            self.cancel_all(True)
         self.shutdown(wait=False)
 
 def gather(*sync_futures: Union[_SyncFutureLike[R], Task[R]], return_exceptions: bool=False) -> _FutureResults[R]: